@@ -21,6 +21,13 @@ from typing import List, Dict, Any, Optional
 
 from loguru import logger
 
+# uvloop事件循环（可选，非Windows平台）
+try:
+    import uvloop
+    HAS_UVLOOP = True
+except ImportError:
+    HAS_UVLOOP = False
+
 from config import settings, PAPER_CATEGORIES
 from models import (
     HFPaper,
@@ -572,4 +579,7 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    if HAS_UVLOOP:
+        uvloop.run(main())
+    else:
+        asyncio.run(main())
\ No newline at end of file
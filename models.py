@@ -203,6 +203,7 @@ class ScrapingStats(BaseModel):
     month: str = Field(description="月份")
     total_papers: int = Field(default=0, description="总论文数")
     filtered_papers: int = Field(default=0, description="过滤后论文数")
+    duplicate_papers: int = Field(default=0, description="已归属更早月份的论文数")
     failed_papers: int = Field(default=0, description="失败数")
     start_time: datetime = Field(default_factory=datetime.now)
     end_time: Optional[datetime] = Field(default=None)
@@ -12,14 +12,17 @@ Features:
 - 支持aiohttp-socks集成
 """
 
+import io
 import os
 import re
 import yaml
 import socket
 import asyncio
+import ipaddress
 import time
+from collections import deque
 from pathlib import Path
-from typing import List, Dict, Optional, Tuple, Any
+from typing import List, Dict, Optional, Tuple, Any, Deque
 from dataclasses import dataclass, field
 from enum import Enum
 import aiohttp
@@ -33,6 +36,9 @@ except ImportError:
     HAS_AIOHTTP_SOCKS = False
     logger.warning("aiohttp-socks 未安装，将使用HTTP代理模式")
 
+# LibYAML加速的加载器（未编译LibYAML时回退到纯Python实现）
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 class ProxyProtocol(str, Enum):
     """代理协议类型"""
@@ -167,17 +173,19 @@ class ClashConfigParser:
             async with aiohttp.ClientSession() as session:
                 async with session.get(url, timeout=timeout) as response:
                     response.raise_for_status()
-                    content = await response.text()
+                    # 直接读取字节，YAML加载器可自行处理编码
+                    raw = await response.read()
             
             # 尝试base64解码
             try:
-                decoded = base64.b64decode(content).decode('utf-8')
-                content = decoded
+                decoded = base64.b64decode(raw)
+                decoded.decode('utf-8')  # 仅校验是否为合法文本
+                raw = decoded
                 logger.debug("订阅内容为base64编码，已解码")
             except Exception:
                 pass  # 非base64，使用原始内容
             
-            data = yaml.safe_load(content)
+            data = yaml.load(io.BytesIO(raw), Loader=YAML_LOADER)
             config = cls._parse_dict(data)
             logger.info(f"✅ 订阅解析完成: {len(config.nodes)} 个节点")
             return config
@@ -339,34 +347,60 @@ class NodeTester:
             logger.debug(f"HTTP测试失败: {e}")
             return float('inf')
     
+    @staticmethod
+    def _subnet_key(server: str) -> str:
+        """
+        节点所属子网（IPv4按/24，IPv6按/64）
+        
+        域名节点无法在不解析DNS的情况下判断子网，按域名本身分组。
+        """
+        try:
+            ip = ipaddress.ip_address(server)
+        except ValueError:
+            return server.lower()
+        prefix = 24 if ip.version == 4 else 64
+        return str(ipaddress.ip_network(f"{ip}/{prefix}", strict=False))
+    
     @classmethod
     async def test_all_nodes(
         cls,
         nodes: List[ProxyNode],
         concurrency: int = 20,
-        timeout: float = 5.0
+        timeout: float = 5.0,
+        per_subnet: int = 2,
     ) -> List[ProxyNode]:
         """
         批量测试所有节点
         
+        同一子网内的节点共享上游链路，并发测试会互相拥塞、抬高延迟，
+        因此除全局并发外，每个子网再单独限制并发。
+        
         Args:
             nodes: 节点列表
             concurrency: 并发数
             timeout: 单个测试超时
+            per_subnet: 同一子网内的并发数
         """
         logger.info(f"🔍 开始测试 {len(nodes)} 个节点 (并发: {concurrency})...")
         
         semaphore = asyncio.Semaphore(concurrency)
+        subnet_semaphores: Dict[str, asyncio.Semaphore] = {}
         
-        async def bounded_test(node: ProxyNode):
-            async with semaphore:
+        async def bounded_test(node: ProxyNode, subnet_semaphore: asyncio.Semaphore):
+            # 先占子网名额，避免同子网节点占满全局并发
+            async with subnet_semaphore, semaphore:
                 latency = await cls.test_tcp_latency(node, timeout)
                 status = "✓" if node.is_available else "✗"
                 lat_str = f"{latency:.0f}ms" if latency < float('inf') else "超时"
                 logger.debug(f"  [{status}] {node.name}: {lat_str}")
                 return node
         
-        tasks = [bounded_test(node) for node in nodes]
+        tasks = []
+        for node in nodes:
+            key = cls._subnet_key(node.server)
+            if key not in subnet_semaphores:
+                subnet_semaphores[key] = asyncio.Semaphore(per_subnet)
+            tasks.append(bounded_test(node, subnet_semaphores[key]))
         await asyncio.gather(*tasks)
         
         # 按延迟排序
@@ -423,6 +457,9 @@ class ProxyManager:
         
         self._node_index = 0
         self._local_proxy_available = False
+        
+        # 可用节点环（存放config.nodes中的索引），轮换时O(1)
+        self._avail_ring: Deque[int] = deque()
     
     async def load_config(
         self, 
@@ -445,6 +482,9 @@ class ProxyManager:
         self.local_http_port = self.config.local_http_port
         self.local_socks_port = self.config.local_socks_port
         
+        # 新配置的节点尚未测试
+        self._avail_ring.clear()
+        
         return self.config
     
     async def test_nodes(
@@ -462,8 +502,17 @@ class ProxyManager:
             timeout=timeout
         )
         
+        self._rebuild_available_ring()
+        
         return self.config.nodes
     
+    def _rebuild_available_ring(self, max_latency: float = 1000) -> None:
+        """根据测试结果重建可用节点环"""
+        self._avail_ring = deque(
+            i for i, n in enumerate(self.config.nodes)
+            if n.is_available and n.latency < max_latency
+        )
+    
     async def check_local_proxy(self) -> bool:
         """检查本地代理是否可用"""
         proxy_url = f"http://127.0.0.1:{self.local_http_port}"
@@ -499,6 +548,7 @@ class ProxyManager:
         
         self.current_node = min(available, key=lambda n: n.latency)
         self._node_index = self.config.nodes.index(self.current_node)
+        self._anchor_ring(self._node_index)
         
         logger.info(f"🚀 选择节点: {self.current_node.name} ({self.current_node.latency:.0f}ms)")
         return self.current_node
@@ -514,19 +564,20 @@ class ProxyManager:
         
         self.current_node = node
         self._node_index = self.config.nodes.index(node)
+        self._anchor_ring(self._node_index)
         return node
     
     def rotate_node(self) -> Optional[ProxyNode]:
         """切换到下一个可用节点"""
-        if not self.config:
+        if not self.config or not self._avail_ring:
             return None
         
-        available = self.config.get_available_nodes()
-        if not available:
-            return None
+        # 环首为当前节点时前移一位；当前节点已被移出环时，环首即下一个节点
+        if self._avail_ring[0] == self._node_index:
+            self._avail_ring.rotate(-1)
         
-        self._node_index = (self._node_index + 1) % len(available)
-        self.current_node = available[self._node_index]
+        self._node_index = self._avail_ring[0]
+        self.current_node = self.config.nodes[self._node_index]
         
         logger.info(f"🔄 切换节点: {self.current_node.name}")
         return self.current_node
@@ -609,8 +660,21 @@ class ProxyManager:
             if self.auto_rotate and self.current_node.fail_count >= self.max_fail_count:
                 logger.warning(f"节点 {self.current_node.name} 失败次数过多，自动切换")
                 self.current_node.is_available = False
+                self._remove_from_ring(self._node_index)
                 self.rotate_node()
     
+    def _anchor_ring(self, index: int) -> None:
+        """将环旋转到指定节点处，下次 rotate_node 切换到它之后的节点"""
+        if index in self._avail_ring:
+            self._avail_ring.rotate(-self._avail_ring.index(index))
+    
+    def _remove_from_ring(self, index: int) -> None:
+        """将节点移出可用环"""
+        if self._avail_ring and self._avail_ring[0] == index:
+            self._avail_ring.popleft()
+        elif index in self._avail_ring:
+            self._avail_ring.remove(index)
+    
     def report_success(self):
         """报告当前节点成功"""
         if self.current_node:
@@ -5,15 +5,18 @@ scraper_ar5iv.py - ar5iv 内容提取模块
 遵循CleanRL设计原则：单一职责、显式依赖、易于测试。
 """
 
+import os
 import re
 import sys
 import asyncio
 import traceback
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
-from typing import List, Optional, Dict, Any
+from pathlib import Path
+from typing import List, Optional, Dict, Any, Iterable, AsyncIterator
 
-import aiohttp
-from bs4 import BeautifulSoup, Tag
+import httpx
+from lxml import etree
 from loguru import logger
 
 from config import settings
@@ -27,6 +30,8 @@ from models import (
 from utils import (
     save_json,
     load_json,
+    save_bytes,
+    dumps_json,
     build_ar5iv_url,
     clean_text,
     truncate_text,
@@ -34,6 +39,81 @@ from utils import (
 )
 
 
+# lxml元素类型及按类名分桶的节点集合
+Element = etree._Element
+NodeBuckets = Dict[str, List[Element]]
+
+
+# ==================== 正则表达式 ====================
+
+_RE_TITLE_SUFFIX = re.compile(r"\s*-\s*ar5iv.*$", re.I)
+_RE_SKIP_SECTION = re.compile(r"^(references|bibliography|appendix)", re.I)
+_RE_REF_NUM = re.compile(r"^\[\d+\]\s*")
+
+
+# 使用lxml.etree原生解析器：元素代理由C层创建，不经过lxml.html逐节点的Python类查找。
+# 解析时丢弃注释和处理指令，减少树节点数
+_HTML_PARSER = etree.HTMLParser(remove_comments=True, remove_pis=True)
+
+
+# ==================== XPath 表达式 ====================
+# 预编译一次，直接在lxml树上求值，避免CSS选择器解析和BS4的Python层树包装。
+# 顶层节点由 _collect_nodes 一次遍历收集，以下表达式只在这些节点内部求值。
+
+def _cls(name: str) -> str:
+    """
+    XPath谓词：class属性包含指定类名（等价于CSS的 .name）
+    
+    先用子串匹配做廉价预过滤，只有命中的节点才做按空白切分的精确匹配，
+    避免对每个节点都执行 normalize-space/concat 拼接字符串。
+    """
+    return (
+        f"(contains(@class, '{name}') and "
+        f"contains(concat(' ', normalize-space(@class), ' '), ' {name} '))"
+    )
+
+
+_XP_HTML_TITLE = etree.XPath("/html/head/title")
+
+# 元素全部文本（等价于lxml.html的text_content），不生成持有树引用的smart string
+_XP_TEXT = etree.XPath("string()", smart_strings=False)
+
+_XP_FIRST_TITLE = etree.XPath(f"descendant::*[{_cls('ltx_title')}][1]")
+_XP_PARAGRAPHS = etree.XPath(f"descendant::*[{_cls('ltx_p')}]")
+_XP_TEXT_WITHOUT_TITLE = etree.XPath(
+    f"descendant::text()[not(ancestor::*[{_cls('ltx_title')}])]"
+)
+_XP_P_PARAGRAPHS = etree.XPath(f"descendant::p[{_cls('ltx_p')}]")
+_XP_SUBSECTION = etree.XPath(f"descendant::section[{_cls('ltx_subsection')}]")
+_XP_FIRST_IMG = etree.XPath("descendant::img[1]")
+_XP_FIGCAPTION = etree.XPath(f"descendant::figcaption[{_cls('ltx_caption')}][1]")
+_XP_PREV_FIGCAPTION = etree.XPath("preceding::figcaption[1]")
+_XP_PREV_CAPTION = etree.XPath(f"preceding::*[{_cls('ltx_caption')}][1]")
+_XP_FIRST_THEAD = etree.XPath("descendant::thead[1]")
+_XP_HEADER_CELLS = etree.XPath("descendant::*[self::th or self::td]")
+_XP_FIRST_TBODY = etree.XPath("descendant::tbody[1]")
+_XP_ROWS = etree.XPath("descendant::tr")
+_XP_DATA_CELLS = etree.XPath("descendant::td")
+_XP_FIRST_MATH = etree.XPath("descendant::math[1]")
+_XP_FIRST_TAG = etree.XPath(f"descendant::*[{_cls('ltx_tag')}][1]")
+
+
+# 顶层节点分桶：类名 -> (桶名, 限定标签)，标签为None时不限定
+_NODE_BUCKETS = {
+    "ltx_title": ("titles", "h1"),
+    "ltx_author": ("authors", None),
+    "ltx_personname": ("personnames", None),
+    "ltx_contact": ("contacts", None),
+    "ltx_abstract": ("abstracts", None),
+    "ltx_section": ("sections", "section"),
+    "ltx_figure": ("figures", "figure"),
+    "ltx_tabular": ("tables", "table"),
+    "ltx_equation": ("equations", None),
+    "ltx_equationgroup": ("equations", None),
+    "ltx_bibitem": ("bibitems", None),
+}
+
+
 class Ar5ivExtractor:
     """
     ar5iv 内容提取器
@@ -47,6 +127,7 @@ class Ar5ivExtractor:
         concurrency: int = 3,
         request_delay: float = 1.5,
         max_retries: int = 3,
+        keep_mathml: bool = False,
     ):
         """
         初始化提取器
@@ -55,19 +136,59 @@ class Ar5ivExtractor:
             concurrency: 并发数
             request_delay: 请求间隔（秒）
             max_retries: 最大重试次数
+            keep_mathml: 是否保存公式的MathML（默认只保存LaTeX）
         """
         self.concurrency = concurrency
         self.request_delay = request_delay
         self.max_retries = max_retries
+        self.keep_mathml = keep_mathml
         self.user_agent = settings.user_agent
         
+        # 请求头只构造一次，作为httpx客户端的默认头
+        self._headers = {
+            "User-Agent": self.user_agent,
+            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+            "Accept-Language": "en-US,en;q=0.5",
+        }
+        
         # 统计
         self.success_count = 0
         self.failure_count = 0
+        
+        # HTML解析进程池（仅在 extract_papers 期间存在）
+        self._parse_pool: Optional[ProcessPoolExecutor] = None
+        
+        # 缓存写入队列（仅在 extract_papers 期间存在），由后台任务统一落盘
+        self._write_queue: Optional[asyncio.Queue] = None
+        
+        # 抓取并发槽位（仅在 extract_papers 期间存在），只覆盖抓取和解析
+        self._fetch_semaphore: Optional[asyncio.Semaphore] = None
+        
+        # 下一次请求最早可发出的时间点（事件循环时间）
+        self._next_request_at = 0.0
+    
+    async def _wait_request_slot(self) -> None:
+        """
+        为本次请求预约发送时间点，在占用并发槽位之前等待
+        
+        相邻请求至少间隔 request_delay / concurrency 秒，
+        整体速率与“每个槽位请求后间隔 request_delay”一致，
+        但等待期间不占用并发槽位。
+        """
+        interval = self.request_delay / max(self.concurrency, 1)
+        if interval <= 0:
+            return
+        
+        now = asyncio.get_running_loop().time()
+        start_at = max(now, self._next_request_at)
+        self._next_request_at = start_at + interval
+        
+        if start_at > now:
+            await asyncio.sleep(start_at - now)
     
     async def _fetch_page(
         self,
-        session: aiohttp.ClientSession,
+        client: httpx.AsyncClient,
         url: str,
         retry_count: int = 0
     ) -> Optional[str]:
@@ -75,45 +196,40 @@ class Ar5ivExtractor:
         获取页面HTML
         
         Args:
-            session: aiohttp会话
+            client: httpx客户端（需已设置默认请求头）
             url: 页面URL
             retry_count: 当前重试次数
             
         Returns:
             HTML内容或None
         """
-        headers = {
-            "User-Agent": self.user_agent,
-            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
-            "Accept-Language": "en-US,en;q=0.5",
-        }
-        
         try:
-            async with session.get(url, headers=headers, timeout=60) as response:
-                if response.status == 200:
-                    # ar5iv页面可能较大，确保完整读取
-                    content = await response.read()
-                    try:
-                        return content.decode('utf-8')
-                    except UnicodeDecodeError:
-                        return content.decode('utf-8', errors='replace')
-                elif response.status == 404:
-                    logger.warning(f"论文不存在: {url}")
-                    return None
-                elif response.status == 429:
-                    wait_time = 120 * (retry_count + 1)
-                    logger.warning(f"速率限制，等待 {wait_time} 秒: {url}")
-                    await asyncio.sleep(wait_time)
-                    if retry_count < self.max_retries:
-                        return await self._fetch_page(session, url, retry_count + 1)
-                else:
-                    logger.warning(f"HTTP {response.status}: {url}")
-                    
-        except asyncio.TimeoutError:
+            # 请求头已在创建客户端时设置，无需逐请求合并
+            response = await client.get(url)
+            if response.status_code == 200:
+                # httpx已完整读取响应体
+                content = response.content
+                try:
+                    return content.decode('utf-8')
+                except UnicodeDecodeError:
+                    return content.decode('utf-8', errors='replace')
+            elif response.status_code == 404:
+                logger.warning(f"论文不存在: {url}")
+                return None
+            elif response.status_code == 429:
+                wait_time = 120 * (retry_count + 1)
+                logger.warning(f"速率限制，等待 {wait_time} 秒: {url}")
+                await asyncio.sleep(wait_time)
+                if retry_count < self.max_retries:
+                    return await self._fetch_page(client, url, retry_count + 1)
+            else:
+                logger.warning(f"HTTP {response.status_code}: {url}")
+                
+        except httpx.TimeoutException:
             logger.warning(f"请求超时: {url}")
             if retry_count < self.max_retries:
                 await asyncio.sleep(10 * (retry_count + 1))
-                return await self._fetch_page(session, url, retry_count + 1)
+                return await self._fetch_page(client, url, retry_count + 1)
                 
         except Exception:
             error_message = format_exception()
@@ -121,82 +237,124 @@ class Ar5ivExtractor:
             
         return None
     
-    def _extract_title(self, soup: BeautifulSoup) -> str:
+    def _find_document(self, root: Element) -> Element:
+        """定位正文容器 article.ltx_document，找不到时回退到整个文档"""
+        for article in root.iter("article"):
+            if "ltx_document" in (article.get("class") or "").split():
+                return article
+        return root
+    
+    def _collect_nodes(self, root: Element) -> NodeBuckets:
+        """
+        单次遍历正文，按类名把各提取器关心的节点分桶
+        
+        代替每个提取器各自对整棵树做一次全量查询；桶内节点保持文档顺序。
+        
+        Args:
+            root: 正文根元素
+            
+        Returns:
+            {桶名: 节点列表}
+        """
+        nodes: NodeBuckets = {
+            bucket: [] for bucket, _ in _NODE_BUCKETS.values()
+        }
+        
+        for elem in root.iter(etree.Element):
+            class_attr = elem.get("class")
+            if not class_attr:
+                continue
+            
+            hit = None
+            for name in class_attr.split():
+                entry = _NODE_BUCKETS.get(name)
+                if entry is None:
+                    continue
+                bucket, tag = entry
+                if (tag is None or elem.tag == tag) and bucket != hit:
+                    nodes[bucket].append(elem)
+                    hit = bucket
+        
+        return nodes
+    
+    def _extract_title(
+        self,
+        nodes: NodeBuckets,
+        root: Element
+    ) -> str:
         """提取论文标题"""
-        title_elem = soup.select_one("h1.ltx_title")
-        if title_elem:
-            return clean_text(title_elem.get_text())
-        
-        # 备选方案
-        title_elem = soup.select_one("title")
-        if title_elem:
-            text = title_elem.get_text()
+        title_elems = nodes["titles"]
+        if title_elems:
+            return clean_text(_XP_TEXT(title_elems[0]))
+        
+        # 备选方案（绝对路径，不受正文上下文限制）
+        title_elems = _XP_HTML_TITLE(root)
+        if title_elems:
+            text = _XP_TEXT(title_elems[0])
             # 移除常见后缀
-            text = re.sub(r"\s*-\s*ar5iv.*$", "", text, flags=re.I)
+            text = _RE_TITLE_SUFFIX.sub("", text)
             return clean_text(text)
         
         return "Unknown Title"
     
-    def _extract_authors(self, soup: BeautifulSoup) -> List[str]:
+    def _extract_authors(self, nodes: NodeBuckets) -> List[str]:
         """提取作者列表"""
         authors = []
         
         # 方法1: ltx_author
-        for author in soup.select(".ltx_author"):
-            name = clean_text(author.get_text())
+        for author in nodes["authors"]:
+            name = clean_text(_XP_TEXT(author))
             if name and len(name) > 1:
                 authors.append(name)
         
         # 方法2: ltx_personname
         if not authors:
-            for person in soup.select(".ltx_personname"):
-                name = clean_text(person.get_text())
+            for person in nodes["personnames"]:
+                name = clean_text(_XP_TEXT(person))
                 if name and len(name) > 1:
                     authors.append(name)
         
         return authors
     
-    def _extract_affiliations(self, soup: BeautifulSoup) -> List[str]:
+    def _extract_affiliations(self, nodes: NodeBuckets) -> List[str]:
         """提取单位列表"""
         affiliations = []
         
-        for contact in soup.select(".ltx_contact"):
-            text = clean_text(contact.get_text())
+        for contact in nodes["contacts"]:
+            text = clean_text(_XP_TEXT(contact))
             if text and "@" not in text:  # 排除邮箱
                 affiliations.append(text)
         
         return affiliations
     
-    def _extract_abstract(self, soup: BeautifulSoup) -> Optional[str]:
+    def _extract_abstract(self, nodes: NodeBuckets) -> Optional[str]:
         """提取摘要"""
-        abstract_elem = soup.select_one(".ltx_abstract")
-        if abstract_elem:
-            # 移除标题
-            title = abstract_elem.select_one(".ltx_title")
-            if title:
-                title.decompose()
+        abstract_elems = nodes["abstracts"]
+        if abstract_elems:
+            abstract_elem = abstract_elems[0]
             
-            # 获取段落文本
-            paragraphs = abstract_elem.select(".ltx_p")
+            # 获取段落文本（标题不是.ltx_p，无需先从树中移除）
+            paragraphs = _XP_PARAGRAPHS(abstract_elem)
             if paragraphs:
-                return clean_text(" ".join(p.get_text() for p in paragraphs))
+                return clean_text(" ".join(_XP_TEXT(p) for p in paragraphs))
             
-            return clean_text(abstract_elem.get_text())
+            # 无段落时取标题以外的全部文本
+            return clean_text("".join(_XP_TEXT_WITHOUT_TITLE(abstract_elem)))
         
         return None
     
-    def _extract_sections(self, soup: BeautifulSoup) -> List[Section]:
+    def _extract_sections(self, nodes: NodeBuckets) -> List[Section]:
         """提取章节结构"""
         sections = []
         
-        for section in soup.select("section.ltx_section"):
+        for section in nodes["sections"]:
             section_data = self._parse_section(section, level=2)
             if section_data:
                 sections.append(section_data)
         
         return sections
     
-    def _parse_section(self, elem: Tag, level: int = 2) -> Optional[Section]:
+    def _parse_section(self, elem: Element, level: int = 2) -> Optional[Section]:
         """
         递归解析章节
         
@@ -207,35 +365,44 @@ class Ar5ivExtractor:
         Returns:
             Section对象或None
         """
-        # 提取标题
-        title_elem = elem.select_one(f"h{level}.ltx_title, .ltx_title")
-        if not title_elem:
+        # 提取标题（h{level}.ltx_title 是 .ltx_title 的子集，取文档序第一个即可）
+        title_elems = _XP_FIRST_TITLE(elem)
+        if not title_elems:
             return None
         
-        title = clean_text(title_elem.get_text())
+        title = clean_text(_XP_TEXT(title_elems[0]))
         
         # 跳过参考文献和附录标题
-        if re.match(r"^(references|bibliography|appendix)", title, re.I):
+        if _RE_SKIP_SECTION.match(title):
             return None
         
+        # 一次遍历直接子元素，同时收集直接段落和ltx_para容器
+        direct_paras = []
+        para_containers = []
+        for child in elem.iterchildren(etree.Element):
+            class_attr = child.get("class")
+            if not class_attr:
+                continue
+            classes = class_attr.split()
+            if child.tag == "p" and "ltx_p" in classes:
+                direct_paras.append(child)
+            if "ltx_para" in classes:
+                para_containers.append(child)
+        
         # 提取段落
-        paragraphs = []
-        for para in elem.find_all("p", class_="ltx_p", recursive=False):
-            text = clean_text(para.get_text())
-            if text and len(text) > 10:
-                paragraphs.append(text)
+        paragraphs = self._clean_paragraphs(direct_paras)
         
         # 如果没有直接段落，查找ltx_para容器
         if not paragraphs:
-            for para_container in elem.find_all(class_="ltx_para", recursive=False):
-                for para in para_container.find_all("p", class_="ltx_p"):
-                    text = clean_text(para.get_text())
-                    if text and len(text) > 10:
-                        paragraphs.append(text)
+            paragraphs = self._clean_paragraphs(
+                para
+                for container in para_containers
+                for para in _XP_P_PARAGRAPHS(container)
+            )
         
         # 递归处理子章节
         subsections = []
-        for subsection in elem.select("section.ltx_subsection"):
+        for subsection in _XP_SUBSECTION(elem):
             sub_data = self._parse_section(subsection, level=level+1)
             if sub_data:
                 subsections.append(sub_data)
@@ -247,28 +414,40 @@ class Ar5ivExtractor:
             subsections=subsections
         )
     
-    def _extract_figures(self, soup: BeautifulSoup) -> List[Figure]:
+    def _clean_paragraphs(self, paras: Iterable[Element]) -> List[str]:
+        """清理段落文本，丢弃不超过10个字符的段落"""
+        paragraphs = []
+        for para in paras:
+            # clean_text只会缩短文本，原文不足阈值的段落直接跳过
+            raw = _XP_TEXT(para)
+            if len(raw) <= 10:
+                continue
+            text = clean_text(raw)
+            if len(text) > 10:
+                paragraphs.append(text)
+        return paragraphs
+    
+    def _extract_figures(self, nodes: NodeBuckets) -> List[Figure]:
         """提取图片"""
         figures = []
         
-        for fig in soup.select("figure.ltx_figure"):
-            img = fig.select_one("img")
-            if not img:
+        for fig in nodes["figures"]:
+            imgs = _XP_FIRST_IMG(fig)
+            if not imgs:
                 continue
+            img = imgs[0]
             
             src = img.get("src", "")
             # 转换为完整URL
-            if src.startswith("/"):
+            if src[:1] == "/":
                 src = f"https://ar5iv.labs.arxiv.org{src}"
             
-            caption_elem = fig.select_one("figcaption.ltx_caption")
-            caption = clean_text(caption_elem.get_text()) if caption_elem else None
+            caption_elems = _XP_FIGCAPTION(fig)
+            caption = clean_text(_XP_TEXT(caption_elems[0])) if caption_elems else None
             
             # 提取标签
-            label = None
             id_attr = fig.get("id", "")
-            if id_attr.startswith("S"):
-                label = id_attr
+            label = id_attr if id_attr[:1] == "S" else None
             
             figures.append(Figure(
                 src=src,
@@ -279,29 +458,30 @@ class Ar5ivExtractor:
         
         return figures
     
-    def _extract_tables(self, soup: BeautifulSoup) -> List[Table]:
+    def _extract_tables(self, nodes: NodeBuckets) -> List[Table]:
         """提取表格"""
         tables = []
         
-        for table in soup.select("table.ltx_tabular"):
+        for table in nodes["tables"]:
             # 提取标题
             caption = None
-            caption_elem = table.find_previous("figcaption") or table.find_previous(class_="ltx_caption")
-            if caption_elem:
-                caption = clean_text(caption_elem.get_text())
+            caption_elems = _XP_PREV_FIGCAPTION(table) or _XP_PREV_CAPTION(table)
+            if caption_elems:
+                caption = clean_text(_XP_TEXT(caption_elems[0]))
             
             # 提取表头
             headers = []
-            thead = table.select_one("thead")
-            if thead:
-                for th in thead.select("th, td"):
-                    headers.append(clean_text(th.get_text()))
+            theads = _XP_FIRST_THEAD(table)
+            if theads:
+                for th in _XP_HEADER_CELLS(theads[0]):
+                    headers.append(clean_text(_XP_TEXT(th)))
             
             # 提取数据行
             rows = []
-            tbody = table.select_one("tbody") or table
-            for tr in tbody.select("tr"):
-                row = [clean_text(td.get_text()) for td in tr.select("td")]
+            tbodies = _XP_FIRST_TBODY(table)
+            tbody = tbodies[0] if tbodies else table
+            for tr in _XP_ROWS(tbody):
+                row = [clean_text(_XP_TEXT(td)) for td in _XP_DATA_CELLS(tr)]
                 if row:
                     rows.append(row)
             
@@ -314,39 +494,46 @@ class Ar5ivExtractor:
         
         return tables
     
-    def _extract_equations(self, soup: BeautifulSoup) -> List[Equation]:
+    def _extract_equations(self, nodes: NodeBuckets) -> List[Equation]:
         """提取数学公式"""
         equations = []
         
-        for eq in soup.select(".ltx_equation, .ltx_equationgroup"):
-            math_elem = eq.select_one("math")
-            if math_elem:
+        for eq in nodes["equations"]:
+            math_elems = _XP_FIRST_MATH(eq)
+            if math_elems:
+                math_elem = math_elems[0]
                 latex = math_elem.get("alttext", "")
-                mathml = str(math_elem)
+                
+                # MathML序列化开销较大且下游未使用，按需生成
+                mathml = None
+                if self.keep_mathml:
+                    mathml = etree.tostring(
+                        math_elem, encoding="unicode", method="html", with_tail=False
+                    )[:1000]  # 限制长度
                 
                 # 提取标签
                 label = None
-                tag = eq.select_one(".ltx_tag")
-                if tag:
-                    label = clean_text(tag.get_text())
+                tags = _XP_FIRST_TAG(eq)
+                if tags:
+                    label = clean_text(_XP_TEXT(tags[0]))
                 
                 equations.append(Equation(
                     latex=latex,
-                    mathml=mathml[:1000] if len(mathml) > 1000 else mathml,  # 限制长度
+                    mathml=mathml,
                     label=label
                 ))
         
         return equations
     
-    def _extract_references(self, soup: BeautifulSoup) -> List[str]:
+    def _extract_references(self, nodes: NodeBuckets) -> List[str]:
         """提取参考文献"""
         references = []
         
-        for ref in soup.select(".ltx_bibitem"):
-            text = clean_text(ref.get_text())
+        for ref in nodes["bibitems"]:
+            text = clean_text(_XP_TEXT(ref))
             if text:
                 # 移除编号
-                text = re.sub(r"^\[\d+\]\s*", "", text)
+                text = _RE_REF_NUM.sub("", text)
                 references.append(text)
         
         return references
@@ -361,24 +548,17 @@ class Ar5ivExtractor:
         Returns:
             完整文本
         """
-        texts = []
-        
-        def extract_section_text(section: Section, depth: int = 0):
-            prefix = "#" * (section.level) + " "
-            texts.append(prefix + section.title)
-            texts.append("")
-            
-            for para in section.paragraphs:
-                texts.append(para)
-                texts.append("")
-            
-            for sub in section.subsections:
-                extract_section_text(sub, depth + 1)
+        blocks = []
         
-        for section in sections:
-            extract_section_text(section)
+        # 显式栈做前序遍历，子章节逆序入栈以保持原有顺序
+        stack = list(reversed(sections))
+        while stack:
+            section = stack.pop()
+            blocks.append("#" * section.level + " " + section.title)
+            blocks.extend(section.paragraphs)
+            stack.extend(reversed(section.subsections))
         
-        return "\n".join(texts)
+        return "\n\n".join(blocks)
     
     def parse_html(self, html: str, paper_id: str) -> Optional[Ar5ivContent]:
         """
@@ -392,17 +572,23 @@ class Ar5ivExtractor:
             Ar5ivContent对象或None
         """
         try:
-            soup = BeautifulSoup(html, "lxml")
+            document = etree.HTML(html, parser=_HTML_PARSER)
+            if document is None:
+                logger.warning(f"HTML为空，无法解析: {paper_id}")
+                return None
+            root = self._find_document(document)
+            
+            nodes = self._collect_nodes(root)
             
-            title = self._extract_title(soup)
-            authors = self._extract_authors(soup)
-            affiliations = self._extract_affiliations(soup)
-            abstract = self._extract_abstract(soup)
-            sections = self._extract_sections(soup)
-            figures = self._extract_figures(soup)
-            tables = self._extract_tables(soup)
-            equations = self._extract_equations(soup)
-            references = self._extract_references(soup)
+            title = self._extract_title(nodes, root)
+            authors = self._extract_authors(nodes)
+            affiliations = self._extract_affiliations(nodes)
+            abstract = self._extract_abstract(nodes)
+            sections = self._extract_sections(nodes)
+            figures = self._extract_figures(nodes)
+            tables = self._extract_tables(nodes)
+            equations = self._extract_equations(nodes)
+            references = self._extract_references(nodes)
             full_text = self._extract_full_text(sections)
             
             return Ar5ivContent(
@@ -426,7 +612,7 @@ class Ar5ivExtractor:
     
     async def extract_paper(
         self,
-        session: aiohttp.ClientSession,
+        client: httpx.AsyncClient,
         paper_id: str,
         force: bool = False
     ) -> Optional[Ar5ivContent]:
@@ -434,7 +620,7 @@ class Ar5ivExtractor:
         提取单篇论文内容
         
         Args:
-            session: aiohttp会话
+            client: httpx客户端
             paper_id: 论文ID
             force: 是否强制重新提取
             
@@ -450,24 +636,49 @@ class Ar5ivExtractor:
                 return Ar5ivContent(**data)
         
         url = build_ar5iv_url(paper_id)
+        
+        # 限速等待在获取并发槽位之前完成，槽位只在抓取和解析期间被占用
+        await self._wait_request_slot()
+        if self._fetch_semaphore:
+            async with self._fetch_semaphore:
+                return await self._fetch_and_parse(client, url, paper_id, cache_file)
+        return await self._fetch_and_parse(client, url, paper_id, cache_file)
+    
+    async def _fetch_and_parse(
+        self,
+        client: httpx.AsyncClient,
+        url: str,
+        paper_id: str,
+        cache_file: Path
+    ) -> Optional[Ar5ivContent]:
+        """抓取并解析单篇论文，成功后写入缓存"""
         logger.info(f"提取论文: {paper_id}")
         
-        html = await self._fetch_page(session, url)
+        html = await self._fetch_page(client, url)
         if not html:
             self.failure_count += 1
             return None
         
-        content = self.parse_html(html, paper_id)
+        if self._parse_pool:
+            # 解析是CPU密集型操作，放到进程池中避免阻塞事件循环
+            loop = asyncio.get_running_loop()
+            content = await loop.run_in_executor(
+                self._parse_pool, _parse_html_worker, html, paper_id, self.keep_mathml
+            )
+        else:
+            content = self.parse_html(html, paper_id)
         if content:
             # 保存到缓存
-            await save_json(content.model_dump(), cache_file)
+            if self._write_queue:
+                await self._write_queue.put(
+                    (cache_file, dumps_json(content.model_dump()))
+                )
+            else:
+                await save_json(content.model_dump(), cache_file)
             self.success_count += 1
         else:
             self.failure_count += 1
         
-        # 添加延迟
-        await asyncio.sleep(self.request_delay)
-        
         return content
     
     async def extract_papers(
@@ -483,34 +694,113 @@ class Ar5ivExtractor:
             force: 是否强制重新提取
             
         Returns:
-            Ar5ivContent列表
+            Ar5ivContent列表（按完成顺序）
         """
-        logger.info(f"开始批量提取 {len(paper_ids)} 篇论文")
+        return [
+            content async for content in self.extract_papers_iter(paper_ids, force)
+        ]
+    
+    async def extract_papers_iter(
+        self,
+        paper_ids: List[str],
+        force: bool = False
+    ) -> AsyncIterator[Ar5ivContent]:
+        """
+        批量提取论文内容，每完成一篇立即产出
         
-        results = []
+        调用方可以边提取边处理，无需等整批结果都驻留内存。
+        提前退出时应调用 aclose() 以释放进程池和客户端。
         
-        async with aiohttp.ClientSession() as session:
-            semaphore = asyncio.Semaphore(self.concurrency)
-            
-            async def bounded_extract(paper_id: str):
-                async with semaphore:
-                    content = await self.extract_paper(session, paper_id, force)
-                    return content
+        Args:
+            paper_ids: 论文ID列表
+            force: 是否强制重新提取
             
-            tasks = [bounded_extract(pid) for pid in paper_ids]
-            extracted = await asyncio.gather(*tasks, return_exceptions=True)
+        Yields:
+            提取成功的Ar5ivContent（按完成顺序）
+        """
+        logger.info(f"开始批量提取 {len(paper_ids)} 篇论文")
+        
+        # 同时解析的页面数不超过并发抓取数
+        workers = min(self.concurrency, os.cpu_count() or 1)
+        self._parse_pool = ProcessPoolExecutor(max_workers=workers)
+        
+        self._write_queue = asyncio.Queue(maxsize=64)
+        writer_task = asyncio.create_task(self._writer_loop(self._write_queue))
+        
+        try:
+            # HTTP/2在单个TLS连接上多路复用并发请求；连接数与并发数一致并保持长连接
+            limits = httpx.Limits(
+                max_connections=self.concurrency,
+                max_keepalive_connections=self.concurrency,
+                keepalive_expiry=60,
+            )
+            async with httpx.AsyncClient(
+                http2=True,
+                headers=self._headers,
+                limits=limits,
+                timeout=60,
+                follow_redirects=True,
+            ) as client:
+                # 槽位由 extract_paper 在抓取时获取，缓存命中和限速等待都不占用槽位
+                self._fetch_semaphore = asyncio.Semaphore(self.concurrency)
+                
+                async def bounded_extract(paper_id: str) -> Optional[Ar5ivContent]:
+                    try:
+                        return await self.extract_paper(client, paper_id, force)
+                    except Exception as e:
+                        logger.error(f"提取 {paper_id} 失败: {e}")
+                        return None
+                
+                # 任务完成后即从集合移除，已产出的结果不会被这里继续引用
+                pending = set()
+                for pid in paper_ids:
+                    task = asyncio.create_task(bounded_extract(pid))
+                    pending.add(task)
+                    task.add_done_callback(pending.discard)
+                
+                try:
+                    for next_done in asyncio.as_completed(pending):
+                        content = await next_done
+                        if content:
+                            yield content
+                finally:
+                    # 调用方提前退出时取消剩余任务，再关闭客户端
+                    for task in pending:
+                        task.cancel()
+                    await asyncio.gather(*pending, return_exceptions=True)
+        finally:
+            self._parse_pool.shutdown(wait=False, cancel_futures=True)
+            self._parse_pool = None
+            self._fetch_semaphore = None
             
-            for i, result in enumerate(extracted):
-                if isinstance(result, Exception):
-                    logger.error(f"提取 {paper_ids[i]} 失败: {result}")
-                elif result:
-                    results.append(result)
+            # 通知写入任务退出，并等待剩余缓存落盘
+            await self._write_queue.put(None)
+            await writer_task
+            self._write_queue = None
         
         logger.info(
             f"提取完成: 成功 {self.success_count}, 失败 {self.failure_count}"
         )
+    
+    async def _writer_loop(self, queue: asyncio.Queue) -> None:
+        """
+        后台写入缓存文件，直到收到None
         
-        return results
+        Args:
+            queue: (文件路径, JSON字节) 队列
+        """
+        while True:
+            item = await queue.get()
+            if item is None:
+                break
+            
+            cache_file, content = item
+            try:
+                await save_bytes(content, cache_file)
+                logger.debug(f"保存缓存: {cache_file}")
+            except Exception:
+                error_message = format_exception()
+                logger.error(f"写入缓存失败 {cache_file}: {error_message}")
     
     def get_stats(self) -> Dict[str, int]:
         """获取统计信息"""
@@ -521,6 +811,23 @@ class Ar5ivExtractor:
         }
 
 
+# 进程池工作进程内复用的提取器实例
+_worker_extractor: Optional[Ar5ivExtractor] = None
+
+
+def _parse_html_worker(
+    html: str,
+    paper_id: str,
+    keep_mathml: bool = False
+) -> Optional[Ar5ivContent]:
+    """进程池入口：模块级函数才能被pickle"""
+    global _worker_extractor
+    if _worker_extractor is None:
+        _worker_extractor = Ar5ivExtractor()
+    _worker_extractor.keep_mathml = keep_mathml
+    return _worker_extractor.parse_html(html, paper_id)
+
+
 def get_all_paragraphs(content: Ar5ivContent) -> List[Dict[str, str]]:
     """
     获取论文所有段落（用于生成评论）
@@ -14,18 +14,46 @@ HTML结构参考 (2024-12):
 - label > div.leading-none: 投票数
 """
 
+import os
 import re
 import sys
+import gzip
+import json
+import time
+import random
+import hashlib
+import heapq
 import asyncio
 import traceback
-from datetime import datetime
-from typing import List, Optional, Dict, Any, Callable
-from functools import wraps
+from concurrent.futures import ProcessPoolExecutor
+from collections import OrderedDict
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from pathlib import Path
+from typing import List, Optional, Dict, Any, Callable, Tuple
+from functools import wraps, lru_cache
+from itertools import islice
 
 import aiohttp
-from bs4 import BeautifulSoup
+import httpx
+import orjson
+from lxml import etree
 from loguru import logger
 
+# httpx的SOCKS代理支持（httpx[socks]）
+try:
+    import socksio  # noqa: F401
+    HAS_HTTPX_SOCKS = True
+except ImportError:
+    HAS_HTTPX_SOCKS = False
+
+# uvloop事件循环（可选，非Windows平台）
+try:
+    import uvloop
+    HAS_UVLOOP = True
+except ImportError:
+    HAS_UVLOOP = False
+
 # 本地模块
 from proxy_manager import ProxyManager, create_proxy_manager
 
@@ -43,20 +71,31 @@ except ImportError:
     from dataclasses import dataclass, field
     from typing import Optional
     
+    class _ConstructMixin:
+        """与pydantic的model_construct/model_dump_json保持相同的调用方式"""
+        
+        @classmethod
+        def model_construct(cls, **kwargs):
+            return cls(**kwargs)
+        
+        def model_dump_json(self) -> str:
+            # orjson原生支持dataclass，直接遍历字段序列化，不经过中间dict
+            return orjson.dumps(self).decode("utf-8")
+    
     @dataclass
-    class PaperMetrics:
+    class PaperMetrics(_ConstructMixin):
         upvotes: int = 0
         comments: int = 0
         github_stars: Optional[int] = None
     
     @dataclass
-    class Organization:
+    class Organization(_ConstructMixin):
         name: str
         logo: Optional[str] = None
         url: Optional[str] = None
     
     @dataclass
-    class HFPaper:
+    class HFPaper(_ConstructMixin):
         paper_id: str
         title: str
         url: str
@@ -69,6 +108,13 @@ except ImportError:
         metrics: PaperMetrics = field(default_factory=PaperMetrics)
         has_video: bool = False
         
+        def __post_init__(self):
+            # 从JSONL加载时嵌套字段是dict，还原为对应的模型
+            if isinstance(self.metrics, dict):
+                self.metrics = PaperMetrics(**self.metrics)
+            if isinstance(self.organization, dict):
+                self.organization = Organization(**self.organization)
+        
         def model_dump(self) -> dict:
             """转换为字典"""
             return {
@@ -100,6 +146,7 @@ except ImportError:
         end_time: Optional[datetime] = None
         total_papers: int = 0
         filtered_papers: int = 0
+        duplicate_papers: int = 0
         
         @property
         def duration_seconds(self) -> float:
@@ -109,39 +156,129 @@ except ImportError:
 
 
 # ============================================
-# 工具函数
+# 正则表达式（模块加载时编译一次）
 # ============================================
 
-def build_hf_monthly_url(month: str) -> str:
-    """构建HuggingFace月度论文URL"""
-    return f"https://huggingface.co/papers?date={month}"
+_RE_SUBMITTED_BY = re.compile(r"Submitted by", re.I)
+_RE_SUBMITTER = re.compile(r"Submitted by\s+(.+)", re.I)
+_RE_DIGITS = re.compile(r"\d+")
+_RE_ORG_HREF = re.compile(r"^/[\w-]+$")
+_RE_GITHUB_PATH = re.compile(r"M128\.001|github", re.I)
+
+# 简单的子串/后缀匹配直接用字符串操作，不走正则
+_VIDEO_EXTENSIONS = (".mp4", ".qt", ".webm")
+
+# 卡片解析时需要收集的标签
+_CARD_TAGS = ("h3", "img", "label", "div", "video")
+
+# <a> 在收集阶段按特征直接分派到的桶（见 _dispatch_anchor）
+_ANCHOR_BUCKETS = ("a_login", "a_org", "a_community", "a_star")
+
+# HTML解析选项：去掉注释以免注释文本混入 itertext()
+_PARSER_OPTIONS = {"remove_comments": True, "remove_pis": True}
 
+# 增量解析时每次送入解析器的字符数
+_FEED_CHUNK_SIZE = 64 * 1024
+
+# 预编译XPath，选择在libxml2内部完成
+# h3内的论文链接（回退方法），论文ID格式仍由 _paper_id_from_href 校验
+_XP_TITLE_LINKS = etree.XPath('//h3//a[starts-with(@href, "/papers/")]')
+
+
+# ============================================
+# lxml 节点辅助函数
+# ============================================
 
-def build_arxiv_url(paper_id: str) -> str:
-    """构建arXiv URL"""
-    return f"https://arxiv.org/abs/{paper_id}"
+def _has_class(el, *names: str) -> bool:
+    """任一类名包含给定的任一子串"""
+    classes = el.get("class")
+    return bool(classes) and any(name in classes for name in names)
 
 
-def build_ar5iv_url(paper_id: str) -> str:
-    """构建ar5iv URL (HTML版arXiv)"""
-    return f"https://ar5iv.org/abs/{paper_id}"
+def _find_tag(el, tag: str, attr: str, pattern: re.Pattern) -> Optional[Any]:
+    """查找首个属性匹配正则的后代元素"""
+    for child in el.iter(tag):
+        value = child.get(attr)
+        if value and pattern.search(value):
+            return child
+    return None
+
+
+def _get_text(el, separator: str = "") -> str:
+    """拼接元素内各段文本（逐段strip并丢弃空白段）"""
+    if len(el) == 0:
+        # 叶子节点（如投票数div、组织名span）只有自身一段文本，不必走itertext
+        return (el.text or "").strip()
+    return separator.join(t.strip() for t in el.itertext() if t.strip())
+
+
+def _parse_count(text: str) -> Optional[int]:
+    """解析计数文本，如 "57"、"1.2k"、"3M"，无法解析时返回None"""
+    text = text.strip().lower()
+    if text.isdigit():
+        return int(text)
+    
+    multiplier = 1
+    if text.endswith("k"):
+        multiplier = 1000
+        text = text[:-1].rstrip()
+    elif text.endswith("m"):
+        multiplier = 1000000
+        text = text[:-1].rstrip()
+    
+    try:
+        return int(float(text) * multiplier)
+    except (ValueError, OverflowError):
+        return None
+
+
+def _is_arxiv_id(s: str) -> bool:
+    """是否为 YYMM.NNNN(N) 格式的arXiv ID"""
+    return (
+        len(s) in (9, 10) and s[4] == "." and s.isascii()
+        and s[:4].isdigit() and s[5:].isdigit()
+    )
+
+
+def _paper_id_from_href(href: Optional[str]) -> Optional[str]:
+    """从 /papers/<arXiv ID> 链接中取出论文ID，不是论文链接时返回None"""
+    if not href or not href.startswith("/papers/"):
+        return None
+    paper_id = href[8:]
+    return paper_id if _is_arxiv_id(paper_id) else None
+
+
+def _single_string(el) -> Optional[str]:
+    """元素只有唯一一段文本（可嵌套在唯一子元素中）时返回该文本，否则None"""
+    while True:
+        if len(el) == 0:
+            return el.text
+        if len(el) > 1 or el.text or el[0].tail:
+            return None
+        el = el[0]
+
+
+# ============================================
+# 工具函数
+# ============================================
+
+@lru_cache(maxsize=256)
+def build_hf_monthly_url(month: str) -> str:
+    """构建HuggingFace月度论文URL"""
+    return f"https://huggingface.co/papers?date={month}"
 
 
 def generate_months(start: str, end: str):
     """生成月份范围"""
-    from datetime import datetime
+    # 换算为绝对月序号（year*12 + month-1），逐个整数还原为YYYY-MM
+    y0, m0 = map(int, start.split("-"))
+    y1, m1 = map(int, end.split("-"))
+    if not (1 <= m0 <= 12 and 1 <= m1 <= 12):
+        raise ValueError(f"无效的月份范围: {start} ~ {end}（应为YYYY-MM）")
     
-    start_date = datetime.strptime(start, "%Y-%m")
-    end_date = datetime.strptime(end, "%Y-%m")
-    
-    current = start_date
-    while current <= end_date:
-        yield current.strftime("%Y-%m")
-        # 移动到下个月
-        if current.month == 12:
-            current = current.replace(year=current.year + 1, month=1)
-        else:
-            current = current.replace(month=current.month + 1)
+    for n in range(y0 * 12 + m0 - 1, y1 * 12 + m1):
+        year, month = divmod(n, 12)
+        yield f"{year:04d}-{month + 1:02d}"
 
 
 def format_exception() -> str:
@@ -149,38 +286,80 @@ def format_exception() -> str:
     return traceback.format_exc().strip().split('\n')[-1]
 
 
-async def save_jsonl(data: List[dict], filepath: str):
-    """保存为JSONL格式"""
-    import json
-    from pathlib import Path
-    
-    Path(filepath).parent.mkdir(parents=True, exist_ok=True)
+def _write_jsonl_models(models: List[Any], filepath: str):
+    """同步写入模型列表为JSONL文件（逐条序列化写入，不拼接整个文件内容）"""
+    path = Path(filepath)
+    path.parent.mkdir(parents=True, exist_ok=True)
     
-    with open(filepath, 'w', encoding='utf-8') as f:
-        for item in data:
-            f.write(json.dumps(item, ensure_ascii=False) + '\n')
+    with open(path, 'w', encoding='utf-8') as f:
+        f.writelines(m.model_dump_json() + "\n" for m in models)
 
 
-async def load_jsonl(filepath: str) -> List[dict]:
-    """加载JSONL文件"""
-    import json
-    from pathlib import Path
+async def save_jsonl_models(models: List[Any], filepath: str):
+    """
+    保存模型列表为JSONL格式
     
-    if not Path(filepath).exists():
+    直接使用pydantic的model_dump_json序列化，不经过中间dict和标准库json。
+    """
+    await asyncio.to_thread(_write_jsonl_models, models, filepath)
+
+
+def _read_jsonl(filepath: str) -> List[dict]:
+    """同步读取JSONL文件（一次读入，orjson逐行解析）"""
+    path = Path(filepath)
+    if not path.exists():
         return []
     
-    data = []
-    with open(filepath, 'r', encoding='utf-8') as f:
-        for line in f:
-            if line.strip():
-                data.append(json.loads(line))
-    return data
+    return [
+        orjson.loads(line)
+        for line in path.read_bytes().splitlines()
+        if line.strip()
+    ]
+
+
+async def load_jsonl(filepath: str) -> List[dict]:
+    """加载JSONL文件（在线程中读盘和解析，不阻塞事件循环）"""
+    return await asyncio.to_thread(_read_jsonl, filepath)
 
 
 # ============================================
 # 重试装饰器
 # ============================================
 
+def _backoff_delay(attempt: int, base_delay: float = 1.0, max_delay: float = 60.0) -> float:
+    """指数退避加随机抖动，避免多个并发任务在同一时刻重试"""
+    delay = min(base_delay * (2 ** attempt), max_delay)
+    return delay + random.uniform(0, base_delay)
+
+
+def _parse_retry_after(value: Optional[str], max_delay: float = 600.0) -> Optional[float]:
+    """
+    解析Retry-After响应头
+    
+    Args:
+        value: 秒数或HTTP日期
+        max_delay: 等待时间上限（秒）
+        
+    Returns:
+        需要等待的秒数，无法解析时返回None
+    """
+    if not value:
+        return None
+    value = value.strip()
+    
+    if value.isdigit():
+        return min(float(value), max_delay)
+    
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    wait = (retry_at - datetime.now(timezone.utc)).total_seconds()
+    return min(max(wait, 0.0), max_delay)
+
+
 def async_retry(
     max_retries: int = 3,
     base_delay: float = 1.0,
@@ -211,8 +390,8 @@ def async_retry(
                     last_exception = e
                     
                     if attempt < max_retries:
-                        # 指数退避
-                        delay = min(base_delay * (2 ** attempt), max_delay)
+                        # 指数退避（带抖动）
+                        delay = _backoff_delay(attempt, base_delay, max_delay)
                         
                         logger.warning(
                             f"重试 {attempt + 1}/{max_retries}: {e.__class__.__name__} - "
@@ -232,6 +411,141 @@ def async_retry(
     return decorator
 
 
+# ============================================
+# 请求限速
+# ============================================
+
+class AsyncRateLimiter:
+    """
+    异步请求限速器
+    
+    为每次请求预约一个发送时间点，相邻时间点至少间隔 interval 秒。
+    只在请求发出前按需等待，解析和保存期间不再额外sleep，
+    整体速率上限为 1/interval 次每秒。
+    """
+    
+    def __init__(self, interval: float):
+        """
+        Args:
+            interval: 相邻请求的最小间隔（秒），<= 0 表示不限速
+        """
+        self.interval = interval
+        self._next_at = 0.0
+    
+    async def acquire(self) -> None:
+        """等待直到轮到本次请求"""
+        if self.interval <= 0:
+            return
+        
+        now = asyncio.get_running_loop().time()
+        start_at = max(now, self._next_at)
+        self._next_at = start_at + self.interval
+        
+        if start_at > now:
+            await asyncio.sleep(start_at - now)
+    
+    async def __aenter__(self) -> "AsyncRateLimiter":
+        await self.acquire()
+        return self
+    
+    async def __aexit__(self, *exc_info) -> None:
+        return None
+
+
+class ByteSemaphore:
+    """
+    按字节数计量的异步信号量
+    
+    限制同时处于解析阶段的页面总大小，而不仅是页面个数，
+    几个特别大的月度页面同时解析时不会把内存占用推得过高。
+    单个请求超过总额度时按总额度计，避免永远等待。
+    """
+    
+    def __init__(self, capacity: int):
+        """
+        Args:
+            capacity: 字节额度上限
+        """
+        self.capacity = capacity
+        self._available = capacity
+        self._cond = asyncio.Condition()
+    
+    async def acquire(self, nbytes: int) -> int:
+        """
+        等待直到有足够额度
+        
+        Returns:
+            实际占用的额度，释放时原样传给 release
+        """
+        nbytes = min(nbytes, self.capacity)
+        async with self._cond:
+            await self._cond.wait_for(lambda: self._available >= nbytes)
+            self._available -= nbytes
+        return nbytes
+    
+    async def release(self, nbytes: int) -> None:
+        """归还额度并唤醒等待者"""
+        async with self._cond:
+            self._available += nbytes
+            self._cond.notify_all()
+
+
+class AdmissionController:
+    """
+    可动态调整上限的异步并发控制
+    
+    与 asyncio.Semaphore 用法相同，但上限可在运行中调整：
+    遇到速率限制时减半（shrink），请求成功后逐个恢复（grow），最高回到初始值。
+    上限降低时已在运行的任务不受影响，只是新的任务需要等待。
+    """
+    
+    def __init__(self, limit: int, min_limit: int = 1):
+        """
+        Args:
+            limit: 初始（也是最大）并发数
+            min_limit: 收缩后的最小并发数
+        """
+        self.max_limit = max(limit, min_limit)
+        self.min_limit = min_limit
+        self.limit = self.max_limit
+        self._active = 0
+        self._cond = asyncio.Condition()
+    
+    async def acquire(self) -> None:
+        """等待直到当前并发数低于上限"""
+        async with self._cond:
+            await self._cond.wait_for(lambda: self._active < self.limit)
+            self._active += 1
+    
+    async def release(self) -> None:
+        """释放一个并发槽位"""
+        async with self._cond:
+            self._active -= 1
+            self._cond.notify()
+    
+    async def shrink(self) -> None:
+        """并发上限减半（不低于 min_limit）"""
+        async with self._cond:
+            limit = max(self.min_limit, self.limit // 2)
+            if limit < self.limit:
+                logger.warning(f"⚠️ 并发上限降低: {self.limit} -> {limit}")
+                self.limit = limit
+    
+    async def grow(self) -> None:
+        """并发上限加一（不超过初始值）"""
+        async with self._cond:
+            if self.limit < self.max_limit:
+                self.limit += 1
+                self._cond.notify()
+    
+    async def __aenter__(self) -> "AdmissionController":
+        await self.acquire()
+        return self
+    
+    async def __aexit__(self, *exc_info) -> None:
+        await self.release()
+
+
 # ============================================
 # HuggingFace 爬虫
 # ============================================
@@ -247,6 +561,18 @@ class HFPapersScraper:
     - 完善的HTML解析
     """
     
+    # 页面缓存有效期（秒），期内重复运行直接使用缓存，不发请求；
+    # 过期后仍发送条件请求，未修改时复用缓存
+    CURRENT_MONTH_MAX_AGE = 600                  # 当前月份
+    SETTLED_MONTH_MAX_AGE = 30 * 24 * 3600       # 早于当前月份两个月以上
+    
+    # 内存中保留的页面解析结果数
+    PARSE_CACHE_SIZE = 64
+    
+    # 同时处于解析阶段（含送往进程池的副本）的页面HTML总内存上限。
+    # 月度页面通常有数MB，默认并发下即可能触发等待；单页超过上限时独占全部额度
+    HTML_BUDGET_BYTES = 8 * 1024 * 1024
+    
     DEFAULT_USER_AGENT = (
         "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
         "AppleWebKit/537.36 (KHTML, like Gecko) "
@@ -261,6 +587,7 @@ class HFPapersScraper:
         request_delay: float = 1.0,
         max_retries: int = 3,
         user_agent: str = None,
+        cache_dir: Optional[str] = "./data/hf_cache",
     ):
         """
         初始化爬虫
@@ -272,6 +599,7 @@ class HFPapersScraper:
             request_delay: 请求间隔（秒）
             max_retries: 最大重试次数
             user_agent: 用户代理字符串
+            cache_dir: 月度页面HTML缓存目录（ETag条件请求），None表示不缓存
         """
         self.proxy_manager = proxy_manager
         self.min_votes = min_votes
@@ -279,131 +607,325 @@ class HFPapersScraper:
         self.request_delay = request_delay
         self.max_retries = max_retries
         self.user_agent = user_agent or self.DEFAULT_USER_AGENT
+        self.cache_dir = Path(cache_dir) if cache_dir else None
         
         # 统计信息
         self.stats: Dict[str, ScrapingStats] = {}
         
-        # 会话（延迟创建）
-        self._session: Optional[aiohttp.ClientSession] = None
+        # HTTP客户端（延迟创建），以及创建时使用的代理
+        self._client: Optional[httpx.AsyncClient] = None
+        self._client_proxy: Optional[str] = None
+        # 各客户端上进行中的请求数；代理切换后被替换的客户端等请求结束再关闭
+        self._client_inflight: Dict[httpx.AsyncClient, int] = {}
+        self._retired_clients: set = set()
+        
+        # 本次 scrape_range 中已出现过的论文ID，跨月份去重
+        # 解析在进程池/线程中独立完成，只在事件循环中通过 _claim_paper_ids 登记
+        self._seen_ids: set = set()
+        
+        # 月度页面解析进程池（仅在 scrape_range 期间存在）
+        self._parse_pool: Optional[ProcessPoolExecutor] = None
+        
+        # 页面解析结果LRU缓存：(HTML摘要, 月份, 阈值) -> (论文列表, 页面论文ID)
+        self._parse_cache: "OrderedDict[Tuple[bytes, str, int], Tuple[List[HFPaper], List[str]]]" = OrderedDict()
+        
+        # 后台写盘队列（仅在 scrape_range 期间存在），由单个写入任务依次处理
+        self._write_queue: Optional[asyncio.Queue] = None
+        
+        # 全局请求限速，代替每个月份爬完后的固定sleep
+        self._limiter = AsyncRateLimiter(request_delay)
+        
+        # 月份级并发控制，遇到429时自动收缩
+        self._admission = AdmissionController(concurrency)
+        
+        # 解析阶段的HTML内存额度
+        self._html_budget = ByteSemaphore(self.HTML_BUDGET_BYTES)
     
-    async def _get_session(self) -> aiohttp.ClientSession:
-        """获取或创建aiohttp会话"""
-        if self._session is None or self._session.closed:
-            if self.proxy_manager:
-                self._session = self.proxy_manager.create_session(timeout=30)
-            else:
-                self._session = aiohttp.ClientSession(
-                    timeout=aiohttp.ClientTimeout(total=30)
+    def _get_proxy_url(self) -> Optional[str]:
+        """
+        当前可用于httpx的代理URL（HTTP代理；SOCKS5需要httpx[socks]）
+        
+        Raises:
+            RuntimeError: 选中了SOCKS节点但未安装httpx[socks]，不静默改为直连
+        """
+        if not self.proxy_manager:
+            return None
+        
+        proxy_url = self.proxy_manager.get_proxy_url(prefer_socks=False)
+        if not proxy_url:
+            return None
+        if proxy_url.startswith("socks"):
+            if not HAS_HTTPX_SOCKS:
+                raise RuntimeError(
+                    f"SOCKS代理 {proxy_url} 需要安装 httpx[socks]: pip install 'httpx[socks]'"
                 )
-        return self._session
+            return proxy_url
+        return proxy_url if proxy_url.startswith("http") else None
+    
+    async def _get_client(self) -> httpx.AsyncClient:
+        """
+        获取或创建HTTP客户端
+        
+        HTTP/2在同一个TLS连接上多路复用各月份的并发请求，省去重复握手。
+        代理在客户端级别设置，代理管理器切换节点后为新代理创建客户端；
+        旧客户端上可能还有其他月份的请求，等它们结束后再关闭（见 _release_client）。
+        """
+        proxy_url = self._get_proxy_url()
+        
+        old_client = None
+        if self._client is not None and not self._client.is_closed:
+            if proxy_url == self._client_proxy:
+                return self._client
+            old_client = self._client
+        
+        self._client = httpx.AsyncClient(
+            http2=True,
+            headers=self._get_headers(),
+            proxy=proxy_url,
+            # 所有请求都发往同一主机，连接数上限即每主机上限，与并发数一致
+            limits=httpx.Limits(
+                max_connections=self.concurrency,
+                max_keepalive_connections=self.concurrency,
+                keepalive_expiry=60,
+            ),
+            timeout=30,
+            follow_redirects=True,
+        )
+        self._client_proxy = proxy_url
+        client = self._client
+        
+        # 先切换引用再等待，其他任务不会重复替换同一个旧客户端
+        if old_client is not None:
+            if self._client_inflight.get(old_client):
+                self._retired_clients.add(old_client)
+            else:
+                await old_client.aclose()
+        return client
+    
+    def _acquire_client(self, client: httpx.AsyncClient) -> None:
+        """登记客户端上的一个进行中请求"""
+        self._client_inflight[client] = self._client_inflight.get(client, 0) + 1
+    
+    async def _release_client(self, client: httpx.AsyncClient) -> None:
+        """请求结束；已被替换的客户端在最后一个请求结束后关闭"""
+        remaining = self._client_inflight.get(client, 1) - 1
+        if remaining > 0:
+            self._client_inflight[client] = remaining
+            return
+        self._client_inflight.pop(client, None)
+        if client in self._retired_clients:
+            self._retired_clients.discard(client)
+            await client.aclose()
     
     async def close(self):
-        """关闭会话"""
-        if self._session and not self._session.closed:
-            await self._session.close()
-            self._session = None
+        """关闭HTTP客户端（包括等待关闭的旧客户端）"""
+        clients = [self._client, *self._retired_clients]
+        self._client = None
+        self._retired_clients.clear()
+        self._client_inflight.clear()
+        for client in clients:
+            if client is not None and not client.is_closed:
+                await client.aclose()
     
     def _get_headers(self) -> Dict[str, str]:
-        """获取请求头"""
+        """
+        获取请求头
+        
+        Accept-Encoding由httpx按已安装的解码器设置（gzip/deflate，
+        安装 httpx[brotli] 后自动加入br），不手动指定以免声明了无法解码的编码；
+        HTTP/2不允许Connection等逐跳头部。
+        """
         return {
             "User-Agent": self.user_agent,
             "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
             "Accept-Language": "en-US,en;q=0.5",
-            "Accept-Encoding": "gzip, deflate, br",
-            "Connection": "keep-alive",
             "Upgrade-Insecure-Requests": "1",
         }
     
+    def _read_page_cache(self, cache_name: str) -> Optional[Tuple[str, Dict[str, str]]]:
+        """
+        读取页面缓存
+        
+        Returns:
+            (HTML, 校验信息{etag, last_modified, fetched_at}) 或 None
+        """
+        html_file = self.cache_dir / f"{cache_name}.html.gz"
+        meta_file = self.cache_dir / f"{cache_name}.meta.json"
+        if not html_file.exists() or not meta_file.exists():
+            return None
+        
+        try:
+            meta = json.loads(meta_file.read_text(encoding="utf-8"))
+            return gzip.decompress(html_file.read_bytes()).decode("utf-8"), meta
+        except (OSError, ValueError, EOFError):
+            logger.debug(f"页面缓存损坏，忽略: {cache_name}")
+            return None
+    
+    def _write_page_cache(self, cache_name: str, html: str, headers) -> None:
+        """保存页面（gzip压缩）及其ETag/Last-Modified，服务器未提供校验信息时不缓存"""
+        meta = {
+            "etag": headers.get("ETag"),
+            "last_modified": headers.get("Last-Modified"),
+            "fetched_at": time.time(),
+        }
+        if not meta["etag"] and not meta["last_modified"]:
+            return
+        
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        (self.cache_dir / f"{cache_name}.html.gz").write_bytes(
+            gzip.compress(html.encode("utf-8"), compresslevel=6)
+        )
+        (self.cache_dir / f"{cache_name}.meta.json").write_text(
+            json.dumps(meta), encoding="utf-8"
+        )
+    
+    def _touch_page_cache(self, cache_name: str, meta: Dict[str, Any], headers) -> None:
+        """
+        服务器确认缓存未修改（304）后刷新抓取时间，重新开始缓存有效期
+        
+        304响应中带有新的ETag/Last-Modified时一并更新。
+        """
+        meta = {
+            "etag": headers.get("ETag") or meta.get("etag"),
+            "last_modified": headers.get("Last-Modified") or meta.get("last_modified"),
+            "fetched_at": time.time(),
+        }
+        (self.cache_dir / f"{cache_name}.meta.json").write_text(
+            json.dumps(meta), encoding="utf-8"
+        )
+    
     async def _fetch_page(
         self,
         url: str,
-        retry_count: int = 0
+        cache_name: Optional[str] = None,
+        max_age: float = 0
     ) -> Optional[str]:
         """
         获取页面HTML（带重试）
         
+        指定 cache_name 时发送条件请求，服务器返回304则直接使用本地缓存。
+        重试在循环内进行，每次尝试前重新获取客户端，代理切换后立即生效。
+        
         Args:
             url: 页面URL
-            retry_count: 当前重试次数
+            cache_name: 缓存文件名（不含扩展名）
+            max_age: 缓存新鲜期（秒），期内直接返回缓存而不发请求
             
         Returns:
             HTML内容或None
         """
-        session = await self._get_session()
-        headers = self._get_headers()
-        
-        # 获取代理参数
-        request_kwargs = {}
-        if self.proxy_manager:
-            request_kwargs = self.proxy_manager.get_request_kwargs()
+        # 条件请求：带上缓存的校验信息（默认请求头已在客户端上设置）
+        headers = {}
+        cached = None
+        if cache_name and self.cache_dir:
+            cached = await asyncio.to_thread(self._read_page_cache, cache_name)
+            if cached:
+                meta = cached[1]
+                if max_age and time.time() - meta.get("fetched_at", 0) < max_age:
+                    logger.info(f"📦 缓存仍在有效期内: {url}")
+                    return cached[0]
+                if meta.get("etag"):
+                    headers["If-None-Match"] = meta["etag"]
+                if meta.get("last_modified"):
+                    headers["If-Modified-Since"] = meta["last_modified"]
         
-        try:
-            async with session.get(
-                url, 
-                headers=headers, 
-                **request_kwargs
-            ) as response:
+        for attempt in range(self.max_retries + 1):
+            can_retry = attempt < self.max_retries
+            
+            try:
+                client = await self._get_client()
+                self._acquire_client(client)
+                try:
+                    await self._limiter.acquire()
+                    response = await client.get(url, headers=headers)
+                finally:
+                    await self._release_client(client)
                 
-                if response.status == 200:
-                    # 正确处理编码
-                    content = await response.read()
-                    try:
-                        html = content.decode('utf-8')
-                    except UnicodeDecodeError:
-                        html = content.decode('utf-8', errors='replace')
+                if response.status_code == 200:
+                    # 按UTF-8解码，非法字节替换而不是抛错
+                    response.encoding = "utf-8"
+                    html = response.text
+                    
+                    if cache_name and self.cache_dir:
+                        await asyncio.to_thread(
+                            self._write_page_cache, cache_name, html, response.headers
+                        )
                     
                     # 报告成功
                     if self.proxy_manager:
                         self.proxy_manager.report_success()
+                    await self._admission.grow()
                     
                     return html
                 
-                elif response.status == 429:
-                    # 速率限制
-                    wait_time = min(60 * (retry_count + 1), 300)
-                    logger.warning(f"⚠️ 速率限制 (429)，等待 {wait_time}s: {url}")
-                    
-                    # 尝试切换代理
+                elif response.status_code == 304 and cached:
+                    logger.info(f"📦 页面未修改，使用缓存: {url}")
+                    await asyncio.to_thread(
+                        self._touch_page_cache, cache_name, cached[1], response.headers
+                    )
+                    if self.proxy_manager:
+                        self.proxy_manager.report_success()
+                    await self._admission.grow()
+                    return cached[0]
+                
+                elif response.status_code == 429:
+                    # 尝试切换代理，并降低并发
                     if self.proxy_manager:
                         self.proxy_manager.report_failure()
+                    await self._admission.shrink()
+                    if not can_retry:
+                        logger.error(f"❌ 速率限制 (429)，重试次数已用尽: {url}")
+                        break
                     
+                    # 速率限制：优先使用服务器给出的Retry-After，否则指数退避
+                    wait_time = _parse_retry_after(response.headers.get("Retry-After"))
+                    if wait_time is None:
+                        wait_time = _backoff_delay(attempt, base_delay=5.0, max_delay=300.0)
+                    logger.warning(f"⚠️ 速率限制 (429)，等待 {wait_time:.1f}s: {url}")
                     await asyncio.sleep(wait_time)
-                    
-                    if retry_count < self.max_retries:
-                        return await self._fetch_page(url, retry_count + 1)
+                    continue
                 
-                elif response.status == 403:
+                elif response.status_code == 403:
                     logger.error(f"❌ 访问被拒绝 (403): {url}")
                     if self.proxy_manager:
                         self.proxy_manager.report_failure()
                 
                 else:
-                    logger.warning(f"⚠️ HTTP {response.status}: {url}")
-                    
-        except asyncio.TimeoutError:
-            logger.warning(f"⏱️ 请求超时: {url}")
-            if self.proxy_manager:
-                self.proxy_manager.report_failure()
-            
-            if retry_count < self.max_retries:
-                await asyncio.sleep(5 * (retry_count + 1))
-                return await self._fetch_page(url, retry_count + 1)
+                    logger.warning(f"⚠️ HTTP {response.status_code}: {url}")
                 
-        except aiohttp.ClientError as e:
-            logger.error(f"❌ 请求失败: {e}")
+                # 其他状态码不重试
+                break
+            
+            except httpx.TimeoutException:
+                logger.warning(f"⏱️ 请求超时: {url}")
+            
+            except httpx.HTTPError as e:
+                logger.error(f"❌ 请求失败: {e}")
+            
+            except Exception:
+                logger.error(f"❌ 未知错误: {format_exception()}")
+                break
+            
+            # 超时和传输错误：报告失败后退避重试
             if self.proxy_manager:
                 self.proxy_manager.report_failure()
-            
-            if retry_count < self.max_retries:
-                await asyncio.sleep(5 * (retry_count + 1))
-                return await self._fetch_page(url, retry_count + 1)
+            if can_retry:
+                await asyncio.sleep(_backoff_delay(attempt, base_delay=2.0))
         
-        except Exception as e:
-            logger.error(f"❌ 未知错误: {format_exception()}")
-            
         return None
     
-    def _parse_papers(self, html: str, month: str) -> List[HFPaper]:
+    def _claim_paper_ids(self, paper_ids: List[str]) -> set:
+        """批量登记论文ID，返回本次成功登记（此前未出现过）的ID"""
+        claimed = set(paper_ids) - self._seen_ids
+        self._seen_ids |= claimed
+        return claimed
+    
+    def _parse_papers(
+        self,
+        html: str,
+        month: str,
+        min_votes: int = 0
+    ) -> Tuple[List[HFPaper], List[str]]:
         """
         解析HTML提取论文列表
         
@@ -411,78 +933,119 @@ class HFPapersScraper:
         - article.relative: 论文卡片容器
         - h3 > a[href^="/papers/"]: 标题链接
         - label > div.leading-none: 投票数
+        
+        投票数低于 min_votes 的论文在解析时即被跳过，不会构造模型对象。
+        只做页面内去重，跨月份去重由调用方通过 _claim_paper_ids 完成。
+        
+        Args:
+            html: 页面HTML
+            month: 月份 YYYY-MM
+            min_votes: 最小投票数
+            
+        Returns:
+            (达到投票阈值的论文列表, 页面上出现的全部论文ID)
         """
-        soup = BeautifulSoup(html, "html.parser")
         papers = []
         seen_ids = set()
         
-        # 方法1: 查找所有article容器
-        articles = soup.find_all("article", class_=re.compile(r"relative"))
+        if not html:
+            return papers, []
+        
+        # 方法1: 增量解析，每个article.relative闭合时立即解析卡片并清空其子树，
+        # 已处理的卡片不会在整棵树中一直驻留
+        parser = etree.HTMLPullParser(events=("end",), tag="article", **_PARSER_OPTIONS)
         
-        if articles:
-            for article in articles:
-                paper = self._parse_article_card(article, month, seen_ids)
+        def consume_articles():
+            for _, article in parser.read_events():
+                if "relative" not in (article.get("class") or "").split():
+                    continue
+                paper = self._parse_article_card(article, month, seen_ids, min_votes)
                 if paper:
                     papers.append(paper)
+                article.clear(keep_tail=True)
+        
+        for start in range(0, len(html), _FEED_CHUNK_SIZE):
+            parser.feed(html[start:start + _FEED_CHUNK_SIZE])
+            consume_articles()
+        root = parser.close()
+        consume_articles()
+        if root is None:
+            return papers, list(seen_ids)
         
         # 方法2: 回退到查找h3内的标题链接
-        if not papers:
-            h3_tags = soup.find_all("h3")
-            for h3 in h3_tags:
-                link = h3.find("a", href=re.compile(r"^/papers/\d{4}\.\d{4,5}"))
-                if not link:
+        if not seen_ids:
+            for link in _XP_TITLE_LINKS(root):
+                paper_id = _paper_id_from_href(link.get("href"))
+                if paper_id is None:
                     continue
-                paper = self._parse_from_title_link(link, month, seen_ids)
+                paper = self._parse_from_title_link(link, paper_id, month, seen_ids, min_votes)
                 if paper:
                     papers.append(paper)
         
-        return papers
+        return papers, list(seen_ids)
     
     def _parse_article_card(
         self, 
         article, 
         month: str, 
-        seen_ids: set
+        seen_ids: set,
+        min_votes: int = 0
     ) -> Optional[HFPaper]:
         """从article卡片解析论文信息"""
         try:
-            h3 = article.find("h3")
-            if not h3:
+            h3 = next(article.iter("h3"), None)
+            if h3 is None:
                 return None
             
-            title_link = h3.find("a", href=re.compile(r"^/papers/\d{4}\.\d{4,5}"))
-            if not title_link:
+            for title_link in h3.iter("a"):
+                paper_id = _paper_id_from_href(title_link.get("href"))
+                if paper_id:
+                    break
+            else:
                 return None
             
-            paper_id = title_link["href"].split("/")[-1]
-            
             if paper_id in seen_ids:
                 return None
-            seen_ids.add(paper_id)
             
-            title = title_link.get_text(strip=True)
+            title = _get_text(title_link)
             if not title or len(title) < 5:
                 return None
+            seen_ids.add(paper_id)
+            
+            # 先只看label取投票数，未达阈值的卡片不再完整遍历和提取其余字段
+            upvotes = None
+            if min_votes > 0:
+                upvotes = self._upvotes_from_labels(article.iter("label"))
+                if upvotes is not None and upvotes < min_votes:
+                    return None
+            
+            # 单次遍历卡片，收集各提取器需要的节点
+            nodes = self._collect_card_nodes(article)
+            
+            if upvotes is None:
+                upvotes = self._extract_upvotes(nodes, paper_id)
+                if upvotes < min_votes:
+                    return None
             
             # 提取各项信息
-            thumbnail = self._extract_thumbnail(article)
-            submitter = self._extract_submitter(article)
-            upvotes = self._extract_upvotes(article, paper_id)
-            organization = self._extract_organization(article, title_link)
-            comments = self._extract_comments(article, paper_id)
-            github_stars = self._extract_github_stars(article)
-            has_video = self._check_has_video(article)
-            
-            return HFPaper(
+            thumbnail = self._extract_thumbnail(nodes)
+            submitter = self._extract_submitter(nodes)
+            organization = self._extract_organization(nodes, title_link)
+            comments = self._extract_comments(nodes, paper_id)
+            github_stars = self._extract_github_stars(nodes)
+            has_video = self._check_has_video(nodes)
+            
+            # 字段均由本模块解析得到，类型已知，跳过pydantic校验
+            return HFPaper.model_construct(
                 paper_id=paper_id,
                 title=title,
                 url=f"https://huggingface.co/papers/{paper_id}",
-                arxiv_url=build_arxiv_url(paper_id),
-                ar5iv_url=build_ar5iv_url(paper_id),
+                arxiv_url=f"https://arxiv.org/abs/{paper_id}",
+                ar5iv_url=f"https://ar5iv.org/abs/{paper_id}",
                 thumbnail=thumbnail,
                 submitter=submitter,
                 organization=organization,
-                metrics=PaperMetrics(
+                metrics=PaperMetrics.model_construct(
                     upvotes=upvotes, 
                     comments=comments,
                     github_stars=github_stars
@@ -498,40 +1061,47 @@ class HFPapersScraper:
     def _parse_from_title_link(
         self,
         link,
+        paper_id: str,
         month: str,
-        seen_ids: set
+        seen_ids: set,
+        min_votes: int = 0
     ) -> Optional[HFPaper]:
         """从标题链接解析论文（回退方法）"""
         try:
-            paper_id = link["href"].split("/")[-1]
-            
             if paper_id in seen_ids:
                 return None
-            seen_ids.add(paper_id)
             
-            title = link.get_text(strip=True)
+            title = _get_text(link)
             if not title or len(title) < 5:
                 return None
+            seen_ids.add(paper_id)
             
             container = self._find_paper_container(link)
-            if not container:
+            if container is None:
                 return None
             
-            return HFPaper(
+            nodes = self._collect_card_nodes(container)
+            
+            upvotes = self._extract_upvotes(nodes, paper_id)
+            if upvotes < min_votes:
+                return None
+            
+            # 字段均由本模块解析得到，类型已知，跳过pydantic校验
+            return HFPaper.model_construct(
                 paper_id=paper_id,
                 title=title,
                 url=f"https://huggingface.co/papers/{paper_id}",
-                arxiv_url=build_arxiv_url(paper_id),
-                ar5iv_url=build_ar5iv_url(paper_id),
-                thumbnail=self._extract_thumbnail(container),
-                submitter=self._extract_submitter(container),
-                organization=self._extract_organization(container, link),
-                metrics=PaperMetrics(
-                    upvotes=self._extract_upvotes(container, paper_id), 
-                    comments=self._extract_comments(container, paper_id),
-                    github_stars=self._extract_github_stars(container)
+                arxiv_url=f"https://arxiv.org/abs/{paper_id}",
+                ar5iv_url=f"https://ar5iv.org/abs/{paper_id}",
+                thumbnail=self._extract_thumbnail(nodes),
+                submitter=self._extract_submitter(nodes),
+                organization=self._extract_organization(nodes, link),
+                metrics=PaperMetrics.model_construct(
+                    upvotes=upvotes, 
+                    comments=self._extract_comments(nodes, paper_id),
+                    github_stars=self._extract_github_stars(nodes)
                 ),
-                has_video=self._check_has_video(container),
+                has_video=self._check_has_video(nodes),
                 month=month,
             )
             
@@ -539,211 +1109,424 @@ class HFPapersScraper:
             logger.debug(f"解析标题链接失败: {format_exception()}")
             return None
     
-    def _find_paper_container(self, link) -> Optional[Any]:
-        """查找论文卡片容器"""
-        container = link.parent
-        max_depth = 10
-        depth = 0
+    def _find_paper_container(self, link, max_depth: int = 6) -> Optional[Any]:
+        """
+        查找论文卡片容器
+        
+        优先取最近的 <article> 祖先（只比较标签名）；没有时才向上检查 max_depth 层祖先，
+        每层最多看前3张图片，避免在深层页面上对大子树反复全量搜索。
+        """
+        article = next(link.iterancestors("article"), None)
+        if article is not None:
+            return article
+        
+        for container in islice(link.iterancestors(), max_depth):
+            if container.tag == "body":
+                break
+            for img in islice(container.iter("img"), 3):
+                src = img.get("src")
+                if src and ("cdn-thumbnails" in src or "cdn-uploads" in src):
+                    return container
+        
+        return link.getparent()
+    
+    def _collect_card_nodes(self, container) -> Dict[str, Any]:
+        """
+        单次遍历卡片子树，按标签名收集节点
         
-        while container and container.name != "body" and depth < max_depth:
-            if container.find("img", src=re.compile(r"cdn-thumbnails|cdn-uploads")):
-                return container
-            container = container.parent
-            depth += 1
+        各提取器只在收集到的节点列表上匹配，无需再各自扫描整个卡片。
+        列表内节点保持文档顺序。
         
-        return link.parent
+        Args:
+            container: 卡片容器
+            
+        Returns:
+            标签名 -> 节点列表，另含 "submitted_owner"（首个含"Submitted by"文本的所属元素）、
+            各 _ANCHOR_BUCKETS 链接列表与 "video_link" 标记
+        """
+        nodes: Dict[str, Any] = {tag: [] for tag in _CARD_TAGS + _ANCHOR_BUCKETS}
+        nodes["submitted_owner"] = None
+        nodes["video_link"] = False
+        
+        for node in container.iterdescendants():
+            tag = node.tag
+            if tag == "a":
+                self._dispatch_anchor(node, nodes)
+            else:
+                bucket = nodes.get(tag)
+                if bucket is not None:
+                    bucket.append(node)
+            
+            if nodes["submitted_owner"] is None:
+                # lxml没有独立的文本节点：text属于元素本身，tail属于父元素
+                if node.text and _RE_SUBMITTED_BY.search(node.text):
+                    nodes["submitted_owner"] = node
+                elif node.tail and _RE_SUBMITTED_BY.search(node.tail):
+                    nodes["submitted_owner"] = node.getparent()
+        
+        return nodes
     
-    def _extract_thumbnail(self, container) -> Optional[str]:
+    @staticmethod
+    def _dispatch_anchor(link, nodes: Dict[str, Any]) -> None:
+        """
+        按 href / class 特征把链接分派到对应字段的桶
+        
+        各提取器只需检查自己的候选链接，不必再各自遍历卡片内全部 <a>。
+        一个链接可能同时落入多个桶，判定细节仍留给提取器。
+        """
+        href = link.get("href") or ""
+        
+        if "/login" in href:
+            nodes["a_login"].append(link)
+        if "#community" in href:
+            nodes["a_community"].append(link)
+        if href.lower().endswith(_VIDEO_EXTENSIONS):
+            nodes["video_link"] = True
+        
+        if _has_class(link, "bg-blue", "border-blue"):
+            nodes["a_org"].append(link)
+        if _has_class(link, "items-center"):
+            nodes["a_star"].append(link)
+    
+    def _extract_thumbnail(self, nodes: Dict[str, Any]) -> Optional[str]:
         """提取缩略图URL"""
-        img = container.find("img", src=re.compile(r"cdn-thumbnails"))
-        return img["src"] if img else None
+        for img in nodes["img"]:
+            src = img.get("src")
+            if src and "cdn-thumbnails" in src:
+                return src
+        return None
     
-    def _extract_submitter(self, container) -> Optional[str]:
+    def _extract_submitter(self, nodes: Dict[str, Any]) -> Optional[str]:
         """提取提交者"""
-        # 方法1: 查找包含"Submitted by"的div
-        divs = container.find_all("div", string=re.compile(r"Submitted by", re.I))
-        for div in divs:
-            full_text = div.get_text(separator=" ", strip=True)
-            match = re.search(r"Submitted by\s+(.+)", full_text, re.I)
+        # 方法1: 查找文本仅为"Submitted by ..."的div
+        for div in nodes["div"]:
+            string = _single_string(div)
+            if not (string and _RE_SUBMITTED_BY.search(string)):
+                continue
+            full_text = _get_text(div, " ")
+            match = _RE_SUBMITTER.search(full_text)
             if match:
                 return match.group(1).strip()
         
-        # 方法2: 查找文本节点
-        submitter_text = container.find(string=re.compile(r"Submitted by", re.I))
-        if submitter_text:
-            parent = submitter_text.parent
-            if parent:
-                texts = []
-                for child in parent.children:
-                    if isinstance(child, str):
-                        text = child.strip()
-                        if text and "Submitted by" not in text:
-                            texts.append(text)
-                
-                if texts:
-                    return texts[-1]
-                
-                full_text = parent.get_text(separator=" ", strip=True)
-                match = re.search(r"Submitted by\s+(.+)", full_text, re.I)
-                if match:
-                    return match.group(1).strip()
+        # 方法2: 查找文本所属元素
+        parent = nodes["submitted_owner"]
+        if parent is not None:
+            texts = []
+            for child_text in [parent.text] + [child.tail for child in parent]:
+                if child_text:
+                    text = child_text.strip()
+                    if text and "Submitted by" not in text:
+                        texts.append(text)
+            
+            if texts:
+                return texts[-1]
+            
+            full_text = _get_text(parent, " ")
+            match = _RE_SUBMITTER.search(full_text)
+            if match:
+                return match.group(1).strip()
         
         return None
     
-    def _extract_upvotes(self, container, paper_id: str) -> int:
+    @staticmethod
+    def _upvotes_from_labels(labels) -> Optional[int]:
+        """从 label div.leading-none 读取投票数，找不到时返回None"""
+        for label in labels:
+            for vote_div in label.iter("div"):
+                if _has_class(vote_div, "leading-none"):
+                    count = _parse_count(_get_text(vote_div))
+                    if count is not None:
+                        return count
+                    break
+        return None
+    
+    def _extract_upvotes(self, nodes: Dict[str, Any], paper_id: str) -> int:
         """提取点赞数"""
-        # 方法1: 查找label内的div.leading-none
-        label = container.find("label", class_=re.compile(r"rounded-xl|cursor-pointer"))
-        if label:
-            vote_div = label.find("div", class_=re.compile(r"leading-none"))
-            if vote_div:
-                text = vote_div.get_text(strip=True)
+        # 方法1: label div.leading-none 直接给出投票数
+        count = self._upvotes_from_labels(nodes["label"])
+        if count is not None:
+            return count
+        
+        # 方法2: 回退到查找登录链接
+        for login_link in nodes["a_login"]:
+            h = login_link.get("href")
+            if "next" in h and paper_id in h:
+                text = _get_text(login_link)
                 if text.isdigit():
                     return int(text)
-                match = re.match(r"([\d.]+)k?", text, re.I)
-                if match:
-                    num = float(match.group(1))
-                    if "k" in text.lower():
-                        num *= 1000
-                    return int(num)
-        
-        # 方法2: 查找包含投票图标的容器
-        vote_containers = container.find_all("label")
-        for vc in vote_containers:
-            svg = vc.find("svg")
-            if svg:
-                path = svg.find("path", d=re.compile(r"M5\.19|triangle", re.I))
-                if path or (svg.get("viewBox") == "0 0 12 12"):
-                    text = vc.get_text(strip=True)
-                    numbers = re.findall(r"\d+", text)
-                    if numbers:
-                        return int(numbers[-1])
-        
-        # 方法3: 回退到查找登录链接
-        login_link = container.find("a", href=re.compile(rf"/login.*next.*{re.escape(paper_id)}"))
-        if login_link:
-            text = login_link.get_text(strip=True)
-            if text.isdigit():
-                return int(text)
+                break
         
         return 0
     
-    def _extract_organization(self, container, paper_link) -> Optional[Organization]:
+    def _extract_organization(self, nodes: Dict[str, Any], paper_link) -> Optional[Organization]:
         """提取组织信息"""
-        org_links = container.find_all("a", class_=re.compile(r"bg-blue|border-blue"))
-        for org_link in org_links:
+        for org_link in nodes["a_org"]:
             href = org_link.get("href", "")
             if "/papers/" in href or "#" in href or href.startswith("http"):
                 continue
-            if not re.match(r"^/[\w-]+$", href):
+            if not _RE_ORG_HREF.match(href):
                 continue
             
-            span = org_link.find("span")
-            if span:
-                name = span.get_text(strip=True)
+            span = next(org_link.iter("span"), None)
+            if span is not None:
+                name = _get_text(span)
             else:
-                name = org_link.get_text(strip=True)
+                name = _get_text(org_link)
             
             if name and len(name) > 1:
-                org_img = org_link.find("img")
-                return Organization(
+                org_img = next(org_link.iter("img"), None)
+                return Organization.model_construct(
                     name=name,
-                    logo=org_img.get("src") if org_img else None,
+                    logo=org_img.get("src") if org_img is not None else None,
                     url=f"https://huggingface.co{href}"
                 )
         
         return None
     
-    def _extract_comments(self, container, paper_id: str) -> int:
+    def _extract_comments(self, nodes: Dict[str, Any], paper_id: str) -> int:
         """提取评论数"""
-        comment_link = container.find("a", href=re.compile(rf"/papers/{re.escape(paper_id)}#community"))
-        if comment_link:
-            text = comment_link.get_text(strip=True)
-            match = re.search(r"(\d+)", text)
-            if match:
-                return int(match.group(1))
+        community_href = f"/papers/{paper_id}#community"
+        for comment_link in nodes["a_community"]:
+            if community_href in comment_link.get("href"):
+                text = _get_text(comment_link)
+                match = _RE_DIGITS.search(text)
+                if match:
+                    return int(match.group())
+                break
         return 0
     
-    def _extract_github_stars(self, container) -> Optional[int]:
+    def _extract_github_stars(self, nodes: Dict[str, Any]) -> Optional[int]:
         """提取GitHub星标数"""
-        links = container.find_all("a", class_=re.compile(r"items-center"))
-        for link in links:
-            svg = link.find("svg")
-            if not svg:
+        for link in nodes["a_star"]:
+            svg = next(link.iter("svg"), None)
+            if svg is None:
                 continue
             
-            viewbox = svg.get("viewBox", "")
+            viewbox = svg.get("viewbox", "")
             if "256 250" not in viewbox:
-                path = svg.find("path", d=re.compile(r"M128\.001|github", re.I))
-                if not path:
+                path = _find_tag(svg, "path", "d", _RE_GITHUB_PATH)
+                if path is None:
                     continue
             
-            text = link.get_text(strip=True)
-            match = re.match(r"([\d.]+)\s*k?", text, re.I)
-            if match:
-                num = float(match.group(1))
-                if "k" in text.lower():
-                    num *= 1000
-                return int(num)
+            count = _parse_count(_get_text(link))
+            if count is not None:
+                return count
         
         return None
     
-    def _check_has_video(self, container) -> bool:
+    def _check_has_video(self, nodes: Dict[str, Any]) -> bool:
         """检查是否有视频"""
-        if container.find("video"):
-            return True
-        if container.find("a", href=re.compile(r"\.(mp4|qt|webm)$", re.I)):
-            return True
-        return False
+        return bool(nodes["video"]) or nodes["video_link"]
     
-    async def scrape_month(self, month: str) -> List[HFPaper]:
+    async def scrape_month(self, month: str, force_refresh: bool = False) -> List[HFPaper]:
         """
         爬取单个月份的论文
         
         Args:
             month: 月份 YYYY-MM
+            force_refresh: 忽略页面缓存有效期，总是向服务器确认
             
         Returns:
             过滤后的论文列表
         """
+        stats = ScrapingStats(month=month)
+        fetched = await self._fetch_month(month, force_refresh)
+        self._record_month(stats, fetched)
+        if fetched is None:
+            return []
+        
+        filtered = self._claim_month(stats, *fetched)
+        self._log_month_done(stats)
+        return filtered
+    
+    async def _fetch_month(
+        self,
+        month: str,
+        force_refresh: bool = False
+    ) -> Optional[Tuple[List[HFPaper], List[str]]]:
+        """
+        获取并解析单个月份页面（不做跨月份去重）
+        
+        Returns:
+            (达到投票阈值的论文列表, 页面上出现的全部论文ID)，页面获取失败时返回None
+        """
         url = build_hf_monthly_url(month)
         logger.info(f"📄 开始爬取 {month}: {url}")
         
-        stats = ScrapingStats(month=month)
-        
-        html = await self._fetch_page(url)
+        max_age = 0 if force_refresh else self._page_max_age(month)
+        html = await self._fetch_page(url, cache_name=month, max_age=max_age)
         if not html:
             logger.error(f"❌ 无法获取页面: {url}")
-            stats.end_time = datetime.now()
-            self.stats[month] = stats
-            return []
+            return None
         
-        # 解析论文
-        papers = self._parse_papers(html, month)
-        stats.total_papers = len(papers)
+        # 解析论文，同时过滤低投票论文
+        # 按字符串实际占用的内存（sys.getsizeof，不复制内容）占用额度，解析完成并丢弃HTML后归还
+        held = await self._html_budget.acquire(sys.getsizeof(html))
+        try:
+            return await self._parse_page(html, month)
+        finally:
+            del html
+            await self._html_budget.release(held)
+    
+    def _record_month(
+        self,
+        stats: ScrapingStats,
+        fetched: Optional[Tuple[List[HFPaper], List[str]]]
+    ) -> None:
+        """
+        记录月份的页面级统计（获取和解析完成即记录，不含等待跨月份登记的时间）
         
-        # 过滤低投票论文
-        filtered = [p for p in papers if p.metrics.upvotes >= self.min_votes]
-        stats.filtered_papers = len(filtered)
+        Args:
+            stats: 月份统计
+            fetched: (达到投票阈值的论文列表, 页面上出现的全部论文ID)，获取失败时为None
+        """
+        if fetched is not None:
+            papers, page_ids = fetched
+            stats.total_papers = len(page_ids)
+            stats.filtered_papers = len(papers)
         stats.end_time = datetime.now()
+        self.stats[stats.month] = stats
+    
+    def _claim_month(
+        self,
+        stats: ScrapingStats,
+        papers: List[HFPaper],
+        page_ids: List[str]
+    ) -> List[HFPaper]:
+        """
+        登记月份中的论文ID，只保留此前未被其他月份登记的论文
         
-        self.stats[month] = stats
+        页面级统计不变，已归属其他月份的数量单独记入 duplicate_papers。
         
+        Returns:
+            去重后的论文列表
+        """
+        # 解析在其他进程/线程中独立完成，跨月份去重在这里统一处理
+        claimed = self._claim_paper_ids(page_ids)
+        stats.duplicate_papers = len(set(page_ids)) - len(claimed)
+        return [p for p in papers if p.paper_id in claimed]
+    
+    def _log_month_done(self, stats: ScrapingStats) -> None:
+        """输出月份完成日志"""
+        duplicates = (
+            f", 其中 {stats.duplicate_papers} 篇已归属更早的月份"
+            if stats.duplicate_papers else ""
+        )
         logger.info(
-            f"✅ 完成 {month}: 发现 {stats.total_papers} 篇, "
-            f"过滤后 {stats.filtered_papers} 篇 (>= {self.min_votes} votes)"
+            f"✅ 完成 {stats.month}: 发现 {stats.total_papers} 篇, "
+            f"过滤后 {stats.filtered_papers} 篇 (>= {self.min_votes} votes){duplicates}"
         )
+    
+    async def _parse_page(self, html: str, month: str) -> Tuple[List[HFPaper], List[str]]:
+        """
+        解析月度页面（带LRU缓存）
         
-        # 添加延迟
-        await asyncio.sleep(self.request_delay)
+        解析是CPU密集型操作，放到进程池（或线程）中执行，其他月份的请求可以继续进行。
+        同一进程内再次遇到相同的页面（如304命中缓存）时直接复用上次的解析结果。
         
-        return filtered
+        Returns:
+            (达到投票阈值的论文列表, 页面上出现的全部论文ID)
+        """
+        digest = hashlib.blake2b(html.encode("utf-8"), digest_size=16).digest()
+        key = (digest, month, self.min_votes)
+        
+        cached = self._parse_cache.get(key)
+        if cached is not None:
+            self._parse_cache.move_to_end(key)
+            logger.debug(f"复用页面解析结果: {month}")
+            return cached
+        
+        if self._parse_pool:
+            loop = asyncio.get_running_loop()
+            result = await loop.run_in_executor(
+                self._parse_pool, _parse_papers_worker, html, month, self.min_votes
+            )
+        else:
+            result = await asyncio.to_thread(
+                _parse_papers_isolated, html, month, self.min_votes
+            )
+        
+        self._parse_cache[key] = result
+        if len(self._parse_cache) > self.PARSE_CACHE_SIZE:
+            self._parse_cache.popitem(last=False)
+        return result
+    
+    def _page_max_age(self, month: str) -> float:
+        """
+        月度页面缓存的有效期
+        
+        当前月份仍在变化，只允许短时间内复用；较早的月份基本不再变化，可长期复用；
+        上个月的投票数仍在增长，每次都发送条件请求确认。
+        """
+        if month == datetime.now().strftime("%Y-%m"):
+            return self.CURRENT_MONTH_MAX_AGE
+        if self._is_settled_month(month):
+            return self.SETTLED_MONTH_MAX_AGE
+        return 0
+    
+    @staticmethod
+    def _is_settled_month(month: str, min_age: int = 2) -> bool:
+        """月份是否早于当前月份至少 min_age 个月"""
+        year, mon = map(int, month.split("-"))
+        now = datetime.now()
+        return (now.year * 12 + now.month) - (year * 12 + mon) >= min_age
+    
+    async def _load_saved_month(
+        self,
+        month: str,
+        filepath: Path
+    ) -> Optional[Tuple[List[HFPaper], List[str]]]:
+        """
+        加载已保存的月度结果（不做跨月份去重）
+        
+        文件中是按保存时的阈值过滤后的论文，这里再按当前阈值过滤一次。
+        当前阈值低于保存时的阈值（或阈值未知）时，文件缺少部分论文，不能复用。
+        
+        Returns:
+            (达到当前阈值的论文列表, 文件中的全部论文ID)，无法复用时返回None（回退到重新爬取）
+        """
+        saved_min_votes = await asyncio.to_thread(self._read_saved_min_votes, filepath)
+        if saved_min_votes is None or saved_min_votes > self.min_votes:
+            logger.info(
+                f"🔄 已保存结果的阈值 ({saved_min_votes}) 高于当前阈值或未知，重新爬取 {month}"
+            )
+            return None
+        
+        try:
+            items = await load_jsonl(str(filepath))
+            papers = [HFPaper(**item) for item in items]
+            filtered = [p for p in papers if p.metrics.upvotes >= self.min_votes]
+        except Exception:
+            logger.warning(f"⚠️ 已保存结果无法加载，重新爬取 {month}: {format_exception()}")
+            return None
+        
+        return filtered, [p.paper_id for p in papers]
+    
+    @staticmethod
+    def _saved_meta_path(filepath: Path) -> Path:
+        """月度结果的元信息文件（记录保存时使用的投票阈值）"""
+        return filepath.with_name(filepath.name + ".meta.json")
+    
+    def _read_saved_min_votes(self, filepath: Path) -> Optional[int]:
+        """读取月度结果保存时的投票阈值，缺失或损坏时返回None"""
+        try:
+            meta = json.loads(self._saved_meta_path(filepath).read_text(encoding="utf-8"))
+            return int(meta["min_votes"])
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+    
+    def _write_saved_meta(self, filepath: Path) -> None:
+        """记录月度结果保存时的投票阈值"""
+        self._saved_meta_path(filepath).write_text(
+            json.dumps({"min_votes": self.min_votes}), encoding="utf-8"
+        )
     
     async def scrape_range(
         self,
         start_month: str,
         end_month: str,
-        save_dir: str = "./data/hf_papers"
+        save_dir: str = "./data/hf_papers",
+        force_refresh: bool = False
     ) -> List[HFPaper]:
         """
         爬取月份范围内的论文
@@ -752,6 +1535,7 @@ class HFPapersScraper:
             start_month: 起始月份 YYYY-MM
             end_month: 结束月份 YYYY-MM
             save_dir: 保存目录
+            force_refresh: 忽略已保存的月度结果，全部重新爬取
             
         Returns:
             所有论文列表
@@ -760,22 +1544,67 @@ class HFPapersScraper:
         logger.info(f"📅 准备爬取 {len(months)} 个月份: {months[0]} 到 {months[-1]}")
         
         all_papers = []
-        semaphore = asyncio.Semaphore(self.concurrency)
+        self._admission = AdmissionController(self.concurrency)
+        self._seen_ids.clear()
+        
+        # 同时解析的页面数不超过并发抓取数
+        workers = min(self.concurrency, len(months), os.cpu_count() or 1)
+        self._parse_pool = ProcessPoolExecutor(max_workers=workers)
+        
+        self._write_queue = asyncio.Queue()
+        writer_task = asyncio.create_task(self._writer_loop(self._write_queue))
+        
+        # 各月份并发获取和解析，但按月份顺序登记论文ID：
+        # 同一篇论文出现在多个月份时，总是归属最早的月份，与完成先后无关
+        claim_turns = [asyncio.Event() for _ in months]
         
-        async def bounded_scrape(month: str) -> List[HFPaper]:
-            async with semaphore:
-                papers = await self.scrape_month(month)
+        async def bounded_scrape(index: int, month: str) -> List[HFPaper]:
+            filepath = Path(save_dir) / f"{month}.jsonl" if save_dir else None
+            stats = ScrapingStats(month=month)
+            try:
+                fetched = None
+                loaded = False
                 
-                # 保存到文件
-                if papers and save_dir:
-                    from pathlib import Path
-                    filepath = Path(save_dir) / f"{month}.jsonl"
-                    await save_jsonl([p.model_dump() for p in papers], str(filepath))
+                # 较早的月份基本不再变化，已有结果时直接复用（不发请求，无需占用并发槽位）
+                if (
+                    filepath and not force_refresh
+                    and self._is_settled_month(month)
+                    and filepath.exists() and filepath.stat().st_size > 0
+                ):
+                    fetched = await self._load_saved_month(month, filepath)
+                    loaded = fetched is not None
                 
+                if fetched is None:
+                    async with self._admission:
+                        fetched = await self._fetch_month(month, force_refresh)
+                
+                # 统计在等待登记顺序之前记录，耗时只包含本月份自身的获取和解析
+                self._record_month(stats, fetched)
+                
+                if index:
+                    await claim_turns[index - 1].wait()
+                
+                if fetched is None:
+                    return []
+                
+                papers = self._claim_month(stats, *fetched)
+            finally:
+                claim_turns[index].set()
+            
+            if loaded:
+                logger.info(f"📦 使用已保存结果 {month}: {len(papers)} 篇")
                 return papers
+            
+            self._log_month_done(stats)
+            
+            # 交给后台写入任务保存，不占用并发槽位
+            if papers and filepath:
+                await self._write_queue.put((papers, filepath))
+            
+            return papers
         
         try:
-            tasks = [bounded_scrape(month) for month in months]
+            tasks = [bounded_scrape(i, month) for i, month in enumerate(months)]
             results = await asyncio.gather(*tasks, return_exceptions=True)
             
             for i, result in enumerate(results):
@@ -785,36 +1614,103 @@ class HFPapersScraper:
                     all_papers.extend(result)
         
         finally:
+            self._parse_pool.shutdown(wait=False, cancel_futures=True)
+            self._parse_pool = None
+            
+            # 通知写入任务退出，并等待所有月份写盘完成
+            await self._write_queue.put(None)
+            await writer_task
+            self._write_queue = None
             await self.close()
         
         logger.info(f"🎉 爬取完成: 共 {len(all_papers)} 篇论文")
         
         return all_papers
     
+    async def _writer_loop(self, queue: asyncio.Queue) -> None:
+        """
+        后台保存月度结果，直到收到None
+        
+        Args:
+            queue: (论文列表, 文件路径) 队列
+        """
+        while True:
+            item = await queue.get()
+            if item is None:
+                break
+            
+            papers, filepath = item
+            try:
+                await save_jsonl_models(papers, str(filepath))
+                await asyncio.to_thread(self._write_saved_meta, filepath)
+                logger.debug(f"💾 已保存: {filepath}")
+            except Exception:
+                logger.error(f"❌ 保存失败 {filepath}: {format_exception()}")
+    
     def get_stats_summary(self) -> Dict[str, Any]:
-        """获取统计摘要"""
-        total_papers = sum(s.total_papers for s in self.stats.values())
-        filtered_papers = sum(s.filtered_papers for s in self.stats.values())
-        total_duration = sum(s.duration_seconds for s in self.stats.values())
+        """获取统计摘要（单次遍历各月份统计）"""
+        total_papers = filtered_papers = duplicate_papers = 0
+        total_duration = 0.0
+        per_month_stats = {}
+        
+        for month, s in self.stats.items():
+            duration = s.duration_seconds
+            total_papers += s.total_papers
+            filtered_papers += s.filtered_papers
+            duplicate_papers += s.duplicate_papers
+            total_duration += duration
+            per_month_stats[month] = {
+                "total": s.total_papers,
+                "filtered": s.filtered_papers,
+                "duplicates": s.duplicate_papers,
+                "duration": duration
+            }
         
         return {
             "months_scraped": len(self.stats),
             "total_papers_found": total_papers,
             "papers_after_filter": filtered_papers,
+            "duplicate_papers": duplicate_papers,
             "filter_threshold": self.min_votes,
             "total_duration_seconds": total_duration,
             "proxy_enabled": self.proxy_manager is not None,
-            "per_month_stats": {
-                month: {
-                    "total": s.total_papers,
-                    "filtered": s.filtered_papers,
-                    "duration": s.duration_seconds
-                }
-                for month, s in self.stats.items()
-            }
+            "per_month_stats": per_month_stats
         }
 
 
+# 进程池工作进程内复用的爬虫实例（只用于解析，不发请求）
+_worker_scraper: Optional[HFPapersScraper] = None
+
+
+def _parse_papers_isolated(
+    html: str,
+    month: str,
+    min_votes: int = 0,
+    scraper: Optional[HFPapersScraper] = None
+) -> Tuple[List[HFPaper], List[str]]:
+    """
+    只对单个页面去重地解析论文，不涉及调用方的跨月份去重状态
+    
+    Returns:
+        (达到投票阈值的论文列表, 页面上出现的全部论文ID)
+    """
+    if scraper is None:
+        scraper = HFPapersScraper(cache_dir=None)
+    return scraper._parse_papers(html, month, min_votes)
+
+
+def _parse_papers_worker(
+    html: str,
+    month: str,
+    min_votes: int = 0
+) -> Tuple[List[HFPaper], List[str]]:
+    """进程池入口：模块级函数才能被pickle"""
+    global _worker_scraper
+    if _worker_scraper is None:
+        _worker_scraper = HFPapersScraper(cache_dir=None)
+    return _parse_papers_isolated(html, month, min_votes, _worker_scraper)
+
+
 # ============================================
 # 便捷函数
 # ============================================
@@ -864,6 +1760,7 @@ async def main():
     parser.add_argument("--proxy", help="代理配置文件或订阅URL")
     parser.add_argument("--output", default="./data/hf_papers", help="输出目录")
     parser.add_argument("--concurrency", type=int, default=3, help="并发数")
+    parser.add_argument("--force-refresh", action="store_true", help="忽略已保存结果，重新爬取所有月份")
     parser.add_argument("--debug", action="store_true", help="调试模式")
     
     args = parser.parse_args()
@@ -913,7 +1810,8 @@ async def main():
     papers = await scraper.scrape_range(
         args.start,
         args.end,
-        save_dir=args.output
+        save_dir=args.output,
+        force_refresh=args.force_refresh
     )
     
     # 显示统计
@@ -927,10 +1825,13 @@ async def main():
     # 显示Top 10
     if papers:
         print(f"\n🏆 Top 10 论文:")
-        papers.sort(key=lambda p: p.metrics.upvotes, reverse=True)
-        for i, paper in enumerate(papers[:10], 1):
+        top = heapq.nlargest(10, papers, key=lambda p: p.metrics.upvotes)
+        for i, paper in enumerate(top, 1):
             print(f"  {i}. [{paper.metrics.upvotes:4d}] {paper.title[:60]}...")
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    if HAS_UVLOOP:
+        uvloop.run(main())
+    else:
+        asyncio.run(main())
\ No newline at end of file
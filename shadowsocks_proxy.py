@@ -13,19 +13,34 @@ import socket
 import requests
 import asyncio
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from operator import attrgetter
 from typing import List, Dict
 from dataclasses import dataclass
 
+# 优先使用LibYAML的C实现解析订阅配置
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
 
-@dataclass
+
+# 不可用节点的延迟标记
+_INF = float('inf')
+
+# 报告中分组显示的地区，按优先级排列：节点名含多个地区时归入靠前的一个
+REGIONS = ['香港', '日本', '台湾', '美国', '韩国', '新加坡']
+
+
+@dataclass(slots=True)
 class ProxyNode:
-    """代理节点"""
+    """代理节点（slots，无实例__dict__）"""
     name: str
     server: str
     port: int
     password: str
     cipher: str
-    latency: float = float('inf')
+    latency: float = _INF
 
 
 class SimpleProxyClient:
@@ -38,8 +53,8 @@ class SimpleProxyClient:
     
     def load_config(self):
         """加载配置"""
-        with open(self.config_file, 'r', encoding='utf-8') as f:
-            data = yaml.safe_load(f)
+        with open(self.config_file, 'rb') as f:
+            data = yaml.load(f, Loader=_YamlLoader)
         
         for proxy in data.get('proxies', []):
             if proxy.get('type') == 'ss':
@@ -57,41 +72,93 @@ class SimpleProxyClient:
     def test_latency(self, node: ProxyNode, timeout: float = 3.0) -> float:
         """测试延迟（TCP连接）"""
         try:
-            start = time.time()
-            sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            sock.settimeout(timeout)
-            sock.connect((node.server, node.port))
-            latency = (time.time() - start) * 1000
-            sock.close()
+            start = time.perf_counter_ns()
+            with socket.create_connection((node.server, node.port), timeout=timeout):
+                latency = (time.perf_counter_ns() - start) / 1e6
             node.latency = latency
             return latency
-        except:
-            node.latency = float('inf')
-            return float('inf')
+        except OSError:
+            node.latency = _INF
+            return _INF
     
-    def test_all_nodes(self):
-        """测试所有节点"""
+    async def test_latency_async(self, node: ProxyNode, timeout: float = 3.0) -> float:
+        """测试延迟（异步TCP连接）"""
+        loop = asyncio.get_running_loop()
+        try:
+            start = loop.time()
+            _, writer = await asyncio.wait_for(
+                asyncio.open_connection(node.server, node.port),
+                timeout=timeout
+            )
+            latency = (loop.time() - start) * 1000
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except OSError:
+                pass
+            node.latency = latency
+            return latency
+        except Exception:
+            node.latency = _INF
+            return _INF
+    
+    async def test_all_nodes_async(self, timeout: float = 3.0, concurrency: int = 64):
+        """并发测试所有节点，总耗时约为最慢的一个而不是全部之和"""
         print("\n🔍 测试节点延迟...")
-        for i, node in enumerate(self.nodes, 1):
-            latency = self.test_latency(node)
-            status = "✅" if latency < float('inf') else "❌"
-            latency_str = f"{latency:.0f}ms" if latency < float('inf') else "超时"
-            print(f"  [{i}/{len(self.nodes)}] {status} {node.name[:40]:40s} {latency_str}")
+        semaphore = asyncio.Semaphore(concurrency)
+        
+        async def bounded_test(node: ProxyNode):
+            async with semaphore:
+                return node, await self.test_latency_async(node, timeout)
+        
+        # 按完成顺序输出，慢节点不阻塞快节点的显示
+        tasks = [bounded_test(node) for node in self.nodes]
+        for i, next_done in enumerate(asyncio.as_completed(tasks), 1):
+            node, latency = await next_done
+            self._print_probe(i, node, latency)
         
         # 排序
-        self.nodes.sort(key=lambda n: n.latency)
+        self.nodes.sort(key=attrgetter('latency'))
     
-    def get_fastest_node(self, region: str = None) -> ProxyNode:
-        """获取最快节点"""
-        nodes = self.nodes
-        if region:
-            nodes = [n for n in nodes if region in n.name]
+    def test_all_nodes(self, timeout: float = 3.0, concurrency: int = 64):
+        """
+        测试所有节点
+        
+        已有运行中的事件循环时（异步代码、notebook）无法使用asyncio.run，
+        改为在线程池中并发执行同步探测；异步调用方应直接 await test_all_nodes_async。
+        """
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            asyncio.run(self.test_all_nodes_async(timeout, concurrency))
+            return
         
-        available = [n for n in nodes if n.latency < float('inf')]
-        if not available:
+        print("\n🔍 测试节点延迟...")
+        with ThreadPoolExecutor(max_workers=max(1, min(concurrency, len(self.nodes)))) as pool:
+            futures = {pool.submit(self.test_latency, node, timeout): node for node in self.nodes}
+            for i, future in enumerate(as_completed(futures), 1):
+                self._print_probe(i, futures[future], future.result())
+        
+        # 排序
+        self.nodes.sort(key=attrgetter('latency'))
+    
+    def _print_probe(self, index: int, node: ProxyNode, latency: float):
+        """输出单个节点的测试结果"""
+        status = "✅" if latency < _INF else "❌"
+        latency_str = f"{latency:.0f}ms" if latency < _INF else "超时"
+        print(f"  [{index}/{len(self.nodes)}] {status} {node.name[:40]:40s} {latency_str}")
+    
+    def get_fastest_node(self, region: str = None) -> ProxyNode:
+        """获取最快节点（nodes已按延迟排序，取第一个可用的即可）"""
+        fastest = next(
+            (n for n in self.nodes
+             if n.latency < _INF and (not region or region in n.name)),
+            None
+        )
+        if fastest is None:
             raise ValueError("没有可用节点")
         
-        return available[0]
+        return fastest
     
     def create_proxy_dict(self, node: ProxyNode) -> Dict:
         """创建代理字典（用于requests）"""
@@ -125,16 +192,13 @@ class SimpleProxyClient:
         # 按地区分组
         regions = {}
         for node in self.nodes:
-            for region in ['香港', '日本', '台湾', '美国', '韩国', '新加坡']:
-                if region in node.name:
-                    if region not in regions:
-                        regions[region] = []
-                    regions[region].append(node)
-                    break
+            region = next((r for r in REGIONS if r in node.name), None)
+            if region:
+                regions.setdefault(region, []).append(node)
         
         # 显示每个地区
         for region, nodes in regions.items():
-            available = [n for n in nodes if n.latency < float('inf')]
+            available = [n for n in nodes if n.latency < _INF]
             print(f"\n🌍 {region} ({len(available)}/{len(nodes)} 可用)")
             
             if available:
@@ -145,12 +209,12 @@ class SimpleProxyClient:
                 print("  ❌ 无可用节点")
         
         # 总体统计
-        total_available = sum(1 for n in self.nodes if n.latency < float('inf'))
+        total_available = sum(1 for n in self.nodes if n.latency < _INF)
         print(f"\n📈 总计: {total_available}/{len(self.nodes)} 可用")
         
         # 最快的5个
         print(f"\n🏆 Top 5 最快节点:")
-        fastest = [n for n in self.nodes if n.latency < float('inf')][:5]
+        fastest = [n for n in self.nodes if n.latency < _INF][:5]
         for i, node in enumerate(fastest, 1):
             print(f"  {i}. {node.name[:50]:50s} {node.latency:6.0f}ms")
 
@@ -194,17 +258,18 @@ class SSLocalStarter:
             return None
 
 
-def demo_basic_usage():
-    """演示基本使用"""
+def demo_basic_usage(client: SimpleProxyClient = None):
+    """演示基本使用（传入已测试的client时跳过加载和测试）"""
     print("="*70)
     print("🚀 Bityun VPN 代理客户端")
     print("="*70)
     
-    # 1. 加载配置
-    client = SimpleProxyClient("1766745722873_bityun_qq.yaml")
-    
-    # 2. 测试所有节点
-    client.test_all_nodes()
+    if client is None:
+        # 1. 加载配置
+        client = SimpleProxyClient("1766745722873_bityun_qq.yaml")
+        
+        # 2. 测试所有节点
+        client.test_all_nodes()
     
     # 3. 显示报告
     client.show_report()
@@ -225,10 +290,11 @@ def demo_basic_usage():
         print(f"\n❌ {e}")
 
 
-def demo_region_select():
-    """演示按地区选择"""
-    client = SimpleProxyClient("1766745722873_bityun_qq.yaml")
-    client.test_all_nodes()
+def demo_region_select(client: SimpleProxyClient = None):
+    """演示按地区选择（传入已测试的client时跳过加载和测试）"""
+    if client is None:
+        client = SimpleProxyClient("1766745722873_bityun_qq.yaml")
+        client.test_all_nodes()
     
     print("\n" + "="*70)
     print("🌏 按地区选择节点")
@@ -287,11 +353,14 @@ def demo_with_requests():
 
 def interactive_menu():
     """交互式菜单"""
+    # 缓存已加载并测试过的客户端，避免每个选项都重新解析YAML和探测节点
+    client = None
+    
     while True:
         print("\n" + "="*70)
         print("📋 菜单")
         print("="*70)
-        print("1. 测试所有节点")
+        print("1. 测试所有节点（重新加载并测试）")
         print("2. 查看测试报告")
         print("3. 选择最快节点")
         print("4. 按地区选择")
@@ -301,19 +370,20 @@ def interactive_menu():
         
         choice = input("\n请选择 (0-5): ").strip()
         
-        if choice == '1':
-            demo_basic_usage()
-        elif choice == '2':
+        # 选项1强制重测，2/3/4首次使用时才加载并测试
+        if choice == '1' or (choice in ('2', '3', '4') and client is None):
             client = SimpleProxyClient("1766745722873_bityun_qq.yaml")
             client.test_all_nodes()
+        
+        if choice == '1':
+            demo_basic_usage(client)
+        elif choice == '2':
             client.show_report()
         elif choice == '3':
-            client = SimpleProxyClient("1766745722873_bityun_qq.yaml")
-            client.test_all_nodes()
             fastest = client.get_fastest_node()
             print(f"\n✨ 最快节点: {fastest.name} ({fastest.latency:.0f}ms)")
         elif choice == '4':
-            demo_region_select()
+            demo_region_select(client)
         elif choice == '5':
             demo_with_requests()
         elif choice == '0':
@@ -5,20 +5,36 @@ utils.py - 工具函数模块
 遵循CleanRL设计原则：纯函数、无副作用、易于测试。
 """
 
+import re
 import sys
 import json
+import time
 import asyncio
 import traceback
 from pathlib import Path
 from datetime import datetime
-from typing import Any, List, Dict, Optional, Generator
+from typing import Any, List, Dict, Optional, Tuple, Generator
 
 import aiofiles
+import orjson
 from loguru import logger
 
 from config import settings
 
 
+# 论文ID：HuggingFace(/papers/) / arXiv(/abs/) / ar5iv(/html/) 链接格式
+_PAPER_ID_RE = re.compile(r"/(?:papers|abs|html)/(\d{4}\.\d{4,5})")
+
+# LLM输出中的```json ... ```代码块（语言标记可省略）
+_JSON_FENCE_RE = re.compile(r"```(?:json)?\s*([\s\S]*?)\s*```")
+
+# 连续空白（与str.split()的空白字符集一致）
+_WS_RE = re.compile(r"\s+")
+
+# 控制字符删除表（保留\t和\n），供str.translate使用
+_CTRL_TABLE = dict.fromkeys(i for i in range(32) if i not in (9, 10))
+
+
 # ==================== 日志配置 ====================
 
 def setup_logging() -> None:
@@ -85,17 +101,15 @@ def generate_months(start: str, end: str) -> Generator[str, None, None]:
     Yields:
         月份字符串 YYYY-MM
     """
-    start_date = datetime.strptime(start, "%Y-%m")
-    end_date = datetime.strptime(end, "%Y-%m")
+    # 换算为绝对月序号（year*12 + month-1），逐个整数还原为YYYY-MM
+    y0, m0 = map(int, start.split("-"))
+    y1, m1 = map(int, end.split("-"))
+    if not (1 <= m0 <= 12 and 1 <= m1 <= 12):
+        raise ValueError(f"无效的月份范围: {start} ~ {end}（应为YYYY-MM）")
     
-    current = start_date
-    while current <= end_date:
-        yield current.strftime("%Y-%m")
-        # 移动到下个月
-        if current.month == 12:
-            current = current.replace(year=current.year + 1, month=1)
-        else:
-            current = current.replace(month=current.month + 1)
+    for n in range(y0 * 12 + m0 - 1, y1 * 12 + m1):
+        year, month = divmod(n, 12)
+        yield f"{year:04d}-{month + 1:02d}"
 
 
 def get_current_timestamp() -> str:
@@ -105,6 +119,9 @@ def get_current_timestamp() -> str:
 
 # ==================== 文件操作 ====================
 
+# datetime交给 _json_default 处理，保持原先 str(datetime) 的输出格式
+_ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+
 async def save_jsonl(data: List[Dict[str, Any]], filepath: Path) -> int:
     """
     异步保存JSONL文件
@@ -116,17 +133,33 @@ async def save_jsonl(data: List[Dict[str, Any]], filepath: Path) -> int:
     Returns:
         保存的记录数
     """
-    filepath.parent.mkdir(parents=True, exist_ok=True)
-    
-    async with aiofiles.open(filepath, "w", encoding="utf-8") as f:
-        for item in data:
-            line = json.dumps(item, ensure_ascii=False, default=str)
-            await f.write(line + "\n")
+    # 整体序列化后一次写入，避免逐行调度aiofiles线程
+    payload = b"".join(
+        orjson.dumps(item, default=_json_default, option=_ORJSON_OPTIONS) + b"\n"
+        for item in data
+    )
+    await save_bytes(payload, filepath)
     
     logger.debug(f"保存JSONL: {filepath} ({len(data)} 条记录)")
     return len(data)
 
 
+async def save_many_jsonl(items: List[Tuple[List[Dict[str, Any]], Path]]) -> List[int]:
+    """
+    并发保存多个JSONL文件
+    
+    用法:
+        await save_many_jsonl([(papers, path_a), (stats, path_b)])
+    
+    Args:
+        items: (数据列表, 文件路径) 列表
+        
+    Returns:
+        每个文件保存的记录数
+    """
+    return await asyncio.gather(*(save_jsonl(data, filepath) for data, filepath in items))
+
+
 async def load_jsonl(filepath: Path) -> List[Dict[str, Any]]:
     """
     异步加载JSONL文件
@@ -141,16 +174,17 @@ async def load_jsonl(filepath: Path) -> List[Dict[str, Any]]:
         logger.warning(f"文件不存在: {filepath}")
         return []
     
+    # 一次读入整个文件，避免逐行唤醒异步迭代器
+    async with aiofiles.open(filepath, "rb") as f:
+        content = await f.read()
+    
     data = []
-    async with aiofiles.open(filepath, "r", encoding="utf-8") as f:
-        async for line in f:
-            line = line.strip()
-            if line:
-                try:
-                    data.append(json.loads(line))
-                except json.JSONDecodeError as e:
-                    logger.warning(f"JSON解析错误: {e}")
-                    continue
+    for line in content.splitlines():
+        if line.strip():
+            try:
+                data.append(orjson.loads(line))
+            except orjson.JSONDecodeError as e:
+                logger.warning(f"JSON解析错误: {e}")
     
     logger.debug(f"加载JSONL: {filepath} ({len(data)} 条记录)")
     return data
@@ -164,14 +198,42 @@ async def save_json(data: Dict[str, Any], filepath: Path) -> None:
         data: 数据字典
         filepath: 文件路径
     """
-    filepath.parent.mkdir(parents=True, exist_ok=True)
-    
-    async with aiofiles.open(filepath, "w", encoding="utf-8") as f:
-        await f.write(json.dumps(data, ensure_ascii=False, indent=2, default=str))
+    await save_bytes(dumps_json(data), filepath)
     
     logger.debug(f"保存JSON: {filepath}")
 
 
+def dumps_json(data: Dict[str, Any]) -> bytes:
+    """
+    序列化为JSON字节（save_json使用的格式）
+    
+    Args:
+        data: 数据字典
+        
+    Returns:
+        UTF-8编码的JSON
+    """
+    return orjson.dumps(
+        data,
+        default=_json_default,
+        option=orjson.OPT_INDENT_2 | _ORJSON_OPTIONS,
+    )
+
+
+async def save_bytes(content: bytes, filepath: Path) -> None:
+    """
+    异步写入字节内容
+    
+    Args:
+        content: 字节内容
+        filepath: 文件路径
+    """
+    filepath.parent.mkdir(parents=True, exist_ok=True)
+    
+    async with aiofiles.open(filepath, "wb") as f:
+        await f.write(content)
+
+
 async def load_json(filepath: Path) -> Optional[Dict[str, Any]]:
     """
     异步加载JSON文件
@@ -186,24 +248,59 @@ async def load_json(filepath: Path) -> Optional[Dict[str, Any]]:
         logger.warning(f"文件不存在: {filepath}")
         return None
     
-    async with aiofiles.open(filepath, "r", encoding="utf-8") as f:
+    async with aiofiles.open(filepath, "rb") as f:
         content = await f.read()
-        return json.loads(content)
+        return orjson.loads(content)
+
+
+class JsonlAppender:
+    """
+    JSONL追加写入器，连续写入多条记录时保持文件打开
+    
+    用法:
+        with JsonlAppender(filepath) as writer:
+            for record in records:
+                writer.write(record)
+    """
+    
+    def __init__(self, filepath: Path):
+        filepath.parent.mkdir(parents=True, exist_ok=True)
+        self.filepath = filepath
+        self._f = open(filepath, "ab")
+    
+    def write(self, data: Dict[str, Any]) -> None:
+        """追加一条记录（写入缓冲区）"""
+        self._f.write(
+            orjson.dumps(data, default=_json_default, option=_ORJSON_OPTIONS) + b"\n"
+        )
+    
+    def flush(self) -> None:
+        """将缓冲区写入磁盘"""
+        self._f.flush()
+    
+    def close(self) -> None:
+        """关闭文件"""
+        self._f.close()
+    
+    def __enter__(self) -> "JsonlAppender":
+        return self
+    
+    def __exit__(self, *exc) -> None:
+        self.close()
 
 
 def append_jsonl_sync(data: Dict[str, Any], filepath: Path) -> None:
     """
-    同步追加JSONL记录
+    同步追加单条JSONL记录
+    
+    每次调用都会打开/关闭文件，批量追加请使用JsonlAppender。
     
     Args:
         data: 数据字典
         filepath: 文件路径
     """
-    filepath.parent.mkdir(parents=True, exist_ok=True)
-    
-    with open(filepath, "a", encoding="utf-8") as f:
-        line = json.dumps(data, ensure_ascii=False, default=str)
-        f.write(line + "\n")
+    with JsonlAppender(filepath) as writer:
+        writer.write(data)
 
 
 # ==================== 文本处理 ====================
@@ -221,13 +318,8 @@ def clean_text(text: str) -> str:
     if not text:
         return ""
     
-    # 移除多余空白
-    text = " ".join(text.split())
-    
-    # 移除控制字符
-    text = "".join(char for char in text if ord(char) >= 32 or char in "\n\t")
-    
-    return text.strip()
+    # 移除多余空白，再移除控制字符
+    return _WS_RE.sub(" ", text).translate(_CTRL_TABLE).strip()
 
 
 def truncate_text(text: str, max_length: int = 100, suffix: str = "...") -> str:
@@ -258,20 +350,8 @@ def extract_paper_id(url: str) -> Optional[str]:
     Returns:
         论文ID或None
     """
-    import re
-    
-    patterns = [
-        r"/papers/(\d{4}\.\d{4,5})",  # HuggingFace格式
-        r"/abs/(\d{4}\.\d{4,5})",      # arXiv格式
-        r"/html/(\d{4}\.\d{4,5})",     # ar5iv格式
-    ]
-    
-    for pattern in patterns:
-        match = re.search(pattern, url)
-        if match:
-            return match.group(1)
-    
-    return None
+    match = _PAPER_ID_RE.search(url)
+    return match.group(1) if match else None
 
 
 # ==================== 异步工具 ====================
@@ -368,22 +448,21 @@ def safe_json_parse(text: str) -> Optional[Dict[str, Any]]:
     except json.JSONDecodeError:
         pass
     
-    # 尝试提取JSON块
-    import re
-    
     # 查找```json ... ```块
-    json_match = re.search(r"```json\s*([\s\S]*?)\s*```", text)
-    if json_match:
-        try:
-            return json.loads(json_match.group(1))
-        except json.JSONDecodeError:
-            pass
-    
-    # 查找{...}块
-    brace_match = re.search(r"\{[\s\S]*\}", text)
-    if brace_match:
+    if "```" in text:
+        json_match = _JSON_FENCE_RE.search(text)
+        if json_match:
+            try:
+                return json.loads(json_match.group(1))
+            except json.JSONDecodeError:
+                pass
+    
+    # 查找最外层{...}块（首个"{"到最后一个"}"）
+    start = text.find("{")
+    end = text.rfind("}")
+    if start != -1 and end > start:
         try:
-            return json.loads(brace_match.group(0))
+            return json.loads(text[start:end + 1])
         except json.JSONDecodeError:
             pass
     
@@ -391,30 +470,28 @@ def safe_json_parse(text: str) -> Optional[Dict[str, Any]]:
     return None
 
 
-def ensure_json_serializable(obj: Any) -> Any:
+def _json_default(obj: Any) -> Any:
     """
-    确保对象可JSON序列化
+    JSON序列化的default钩子：编码器遇到无法处理的对象时才调用
+    
+    返回值会继续由编码器递归处理，无需预先遍历整个对象树。
     
     Args:
-        obj: 任意对象
+        obj: 无法直接序列化的对象
         
     Returns:
-        可序列化的对象
+        可序列化的替代值
     """
     if isinstance(obj, datetime):
-        return obj.isoformat()
-    elif isinstance(obj, Path):
+        # 与原 json.dumps(default=str) 的输出保持一致（空格分隔日期和时间）
         return str(obj)
-    elif hasattr(obj, "model_dump"):
+    if isinstance(obj, Path):
+        return str(obj)
+    if hasattr(obj, "model_dump"):
         return obj.model_dump()
-    elif hasattr(obj, "__dict__"):
-        return {k: ensure_json_serializable(v) for k, v in obj.__dict__.items()}
-    elif isinstance(obj, dict):
-        return {k: ensure_json_serializable(v) for k, v in obj.items()}
-    elif isinstance(obj, (list, tuple)):
-        return [ensure_json_serializable(item) for item in obj]
-    else:
-        return obj
+    if hasattr(obj, "__dict__"):
+        return obj.__dict__
+    return str(obj)
 
 
 # ==================== 进度显示 ====================
@@ -424,12 +501,15 @@ class ProgressTracker:
     进度追踪器
     """
     
-    def __init__(self, total: int, desc: str = "Processing"):
+    def __init__(self, total: int, desc: str = "Processing", log_interval: float = 0.5):
         self.total = total
         self.current = 0
         self.desc = desc
-        self.start_time = datetime.now()
+        self.start_time = time.monotonic()
         self.errors = 0
+        # 日志最小间隔（秒），完成时总会输出
+        self.log_interval = log_interval
+        self._last_log = float("-inf")
     
     def update(self, n: int = 1, error: bool = False) -> None:
         """更新进度"""
@@ -437,7 +517,12 @@ class ProgressTracker:
         if error:
             self.errors += 1
         
-        elapsed = (datetime.now() - self.start_time).total_seconds()
+        now = time.monotonic()
+        if now - self._last_log < self.log_interval and self.current < self.total:
+            return
+        self._last_log = now
+        
+        elapsed = now - self.start_time
         rate = self.current / elapsed if elapsed > 0 else 0
         eta = (self.total - self.current) / rate if rate > 0 else 0
         
@@ -449,7 +534,7 @@ class ProgressTracker:
     
     def finish(self) -> Dict[str, Any]:
         """完成并返回统计"""
-        elapsed = (datetime.now() - self.start_time).total_seconds()
+        elapsed = time.monotonic() - self.start_time
         return {
             "total": self.total,
             "completed": self.current,